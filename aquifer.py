@@ -4,27 +4,371 @@ Date: 5/22/2024
 Description: Aquifer - A comprehensive database synchronization tool supporting MySQL, PostgreSQL, MongoDB, Neo4j, SQL Server, and Oracle.
              This script was developed with the assistance of GPT-4 by OpenAI.
 """
+import re
 import json
+import datetime
 import argparse
 import hashlib
 import logging
-import mysql.connector
-import psycopg2
-import pymongo
-import pyodbc
-import cx_Oracle
-from neo4j import GraphDatabase
+import functools
+import operator
+import queue
+import threading
+import multiprocessing
+import multiprocessing.util
 from abc import ABC, abstractmethod
-from mysql.connector import Error as MySQLError
-from psycopg2 import Error as PGError
-from pyodbc import Error as ODBCError
-from cx_Oracle import Error as OracleError
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+DEFAULT_MAX_WORKERS = 4
+LOG_FLUSH_SIZE = 500
+_LOG_STOP = object()
+STREAM_BATCH_SIZE = 1000
+
+# Identifies the version of this script that made each logged change;
+# hashed once per process rather than on every run of main()
+with open(__file__, 'rb') as _f:
+    _SOURCE_HASH = hashlib.blake2b(_f.read(), digest_size=16).hexdigest()
+del _f
+
+_AUTO_INCREMENT_RE = re.compile(r"\s+AUTO_INCREMENT=\d+")
+# String literals, E-strings, quoted identifiers and dollar-quoted bodies are
+# kept verbatim; comments and whitespace runs become one space
+_DDL_TOKEN_RE = re.compile(r"""(\b[Ee]'(?:[^'\\]|\\.|'')*'|'(?:[^']|'')*'|"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[(?:[^\]]|\]\])*\]|(?<!\w)(\$(?:[A-Za-z_]\w*)?\$).*?\2)|(?:--[^\n]*|/\*.*?\*/|\s+)+""", re.DOTALL)
+# Module definitions that can be swapped in place without dropping them first
+_SQLSERVER_CREATE_RE = re.compile(r"^\s*CREATE\s+(?:OR\s+ALTER\s+)?(VIEW|PROC(?:EDURE)?)\b", re.IGNORECASE)
+_ORACLE_CREATE_OR_REPLACE_RE = re.compile(r"\s*CREATE\s+OR\s+REPLACE\b", re.IGNORECASE)
+_ORACLE_SIMPLE_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9_$#]*")
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_ddl(ddl):
+    # AUTO_INCREMENT counters, comments and layout change without the schema changing
+    return _DDL_TOKEN_RE.sub(lambda m: m.group(1) or " ", _AUTO_INCREMENT_RE.sub("", ddl)).strip()
+
+def _ddl_hash(ddl):
+    if ddl is None:
+        return None
+    # Signed 64-bit so it fits a BIGINT column on both MySQL and PostgreSQL
+    digest = hashlib.blake2b(_normalize_ddl(ddl).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+def _same_ddl(a, b):
+    return _ddl_hash(a) == _ddl_hash(b)
+
+def _quote_mysql_identifier(name):
+    return "`" + name.replace("`", "``") + "`"
+
+def _quote_sqlserver_identifier(name):
+    return "[" + name.replace("]", "]]") + "]"
+
+def _quote_oracle_identifier(name):
+    # Simple names stay unquoted so they keep Oracle's case-insensitive lookup
+    if _ORACLE_SIMPLE_NAME_RE.fullmatch(name):
+        return name
+    return '"' + name.replace('"', '""') + '"'
+
+def _sqlserver_column_type(data_type, max_length, precision, scale):
+    if data_type in ("decimal", "numeric"):
+        return f"{data_type}({precision}, {scale})"
+    if max_length is None or data_type in ("text", "ntext", "image", "xml"):
+        return data_type
+    return f"{data_type}({'MAX' if max_length == -1 else max_length})"
+
+# Pools outlive the sync instances that create them, so repeated runs in one
+# process reuse established connections instead of reconnecting
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+def _shared_pool(key, create):
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = create()
+        return pool
+
+def _plsql_block(statements):
+    # Oracle runs one statement per call; EXECUTE IMMEDIATE lets several DDL
+    # statements share a round-trip
+    return "BEGIN\n" + "".join("EXECUTE IMMEDIATE '" + statement.replace("'", "''") + "';\n" for statement in statements) + "END;"
+
+def _object_locked(object_type):
+    # Holds a per-object advisory lock on the target for the duration of the
+    # sync so concurrent workers only contend on the same object
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, name, *args, cursor=None, **kwargs):
+            if cursor is None:
+                cursor = self.cursor
+            key = f"aquifer:{object_type}:{name}"
+            if not self._acquire_object_lock(cursor, key):
+                logging.info("%s %s is being synchronized by another worker. Skipping.", object_type.capitalize(), name)
+                return
+            try:
+                return method(self, name, *args, cursor=cursor, **kwargs)
+            finally:
+                self._release_object_lock(cursor, key)
+        return wrapper
+    return decorate
+
 class DatabaseSync(ABC):
-    def __init__(self, config):
+    LOG_PARAM = "%s"
+    ROLLBACK_METHODS = {"table": "rollback_table", "view": "rollback_view", "procedure": "rollback_procedure"}
+    _batch = None
+    _batch_callbacks = None
+
+    def __init__(self, config, max_workers=DEFAULT_MAX_WORKERS):
         self.config = config
+        self.max_workers = max_workers
+        self._log_lock = threading.RLock()
+        self._log_queue = queue.Queue()
+        self._log_thread = None
+        self._ddl_cache = {}
+        self._existing_tables = None
+        self._existing_views = None
+        self._existing_procedures = None
+        self._last_hash = {}
+        self._cursor_lock = threading.RLock()
+        self.source_sync = None
+        self.skip_unmodified = False
+        self._all_indexes = None
+        self._source_indexes = None
+        self._schema_cache = {}
+    
+    def _pool_key(self, size):
+        return (type(self).__name__, json.dumps(self.config, sort_keys=True, default=str), size)
+    
+    def attach_source(self, source_sync):
+        self.source_sync = source_sync
+    
+    def get_definition(self, object_type, name, cursor=None):
+        getter = {"table": self.get_table_definition, "view": self.get_view_definition, "procedure": self.get_procedure_definition}[object_type]
+        return getter(name, cursor)
+    
+    def _cached(self, key, load):
+        # A source shared by several targets is introspected once per run.
+        # Concurrent misses may both load, which only costs the extra query.
+        try:
+            return self._schema_cache[key]
+        except KeyError:
+            value = self._schema_cache[key] = load()
+            return value
+    
+    def _iter_cached(self, key, rows):
+        cached = self._schema_cache.get(key)
+        if cached is not None:
+            yield from cached
+            return
+        collected = []
+        for row in rows():
+            collected.append(row)
+            yield row
+        # Only a fully read listing is reused
+        self._schema_cache[key] = collected
+    
+    def _source_definition(self, object_type, name, cursor=None):
+        # Without an attached source the target is compared with itself, as before
+        if self.source_sync is None:
+            return self.get_definition(object_type, name, cursor)
+        return self.source_sync._cached(("definition", object_type, name), functools.partial(self.source_sync._borrowed_definition, object_type, name))
+    
+    def _borrowed_definition(self, object_type, name):
+        # Borrow from the pool so concurrent workers don't queue on the main
+        # cursor
+        with self._borrow() as conn:
+            cursor = conn.cursor()
+            try:
+                return self.get_definition(object_type, name, cursor)
+            finally:
+                cursor.close()
+    
+    def list_objects(self, object_type):
+        self.cursor.execute(self.LIST_OBJECTS_SQL[object_type])
+        return list(map(operator.itemgetter(0), self.cursor.fetchall()))
+    
+    def _source_names(self, object_type, target_names):
+        if self.source_sync is None:
+            return list(target_names)
+        # Streamed so workers start on the first objects while the rest of
+        # the list is still arriving
+        return self.source_sync._iter_cached(("names", object_type), functools.partial(self.source_sync.iter_objects, object_type))
+    
+    def _load_all_hashes(self, object_type):
+        self.cursor.execute(self.HASHES_SQL[object_type])
+        return dict(self.cursor.fetchall())
+    
+    def _source_hashes(self, object_type, target_hashes, source_hashes):
+        # Streams source names to _sync_all while filling source_hashes, so the
+        # first objects are being synchronized while the rest are still listed
+        rows = target_hashes.items() if self.source_sync is None else self.source_sync._iter_cached(("hashes", object_type), functools.partial(self.source_sync.iter_hashes, object_type))
+        for name, ddl_hash in rows:
+            source_hashes[name] = ddl_hash
+            yield name
+    
+    def _load_source_table_ddl(self, target_ddl, skip=()):
+        if self.source_sync is None:
+            return target_ddl
+        with self.source_sync._cursor_lock:
+            source_ddl = self.source_sync._cached(("table_ddl", frozenset(skip)), functools.partial(self.source_sync._load_all_table_ddl, skip))
+        # Remember which source tables are missing on the target so workers
+        # don't probe for them again
+        for table in source_ddl:
+            self._ddl_cache.setdefault(("table", table), None)
+        return source_ddl
+    
+    def _table_change_times(self):
+        return {}
+    
+    def _unmodified_tables(self):
+        # Tables whose catalog change time on the source predates their last
+        # logged sync don't need their DDL fetched at all
+        if not self.skip_unmodified:
+            return set()
+        source = self.source_sync or self
+        with source._cursor_lock:
+            changed_at = source._cached("change_times", source._table_change_times)
+        last_sync = self._load_last_sync_times("table")
+        # A table dropped on the target since its last sync, by a rollback or
+        # by hand, has to be recreated however old its source change is
+        existing = set(self.list_objects("table"))
+        return {table for table, ts in changed_at.items() if ts is not None and table in last_sync and ts < last_sync[table] and table in existing}
+    
+    def _missing_index_statements(self, table):
+        # Index metadata for the whole schema is fetched once per run, on both
+        # sides, the first time any table's indexes are synchronized
+        if self._all_indexes is None:
+            self._all_indexes = self._load_all_indexes()
+            if self.source_sync is None:
+                self._source_indexes = self._all_indexes
+            else:
+                with self.source_sync._cursor_lock:
+                    self._source_indexes = self.source_sync._cached("indexes", self.source_sync._load_all_indexes)
+        existing = {index_name for index_name, _ in self._all_indexes.get(table, [])}
+        return [statement for index_name, statement in self._source_indexes.get(table, []) if index_name not in existing]
+    
+    def _cached_definition(self, object_type, name, fetch):
+        key = (object_type, name)
+        if key not in self._ddl_cache:
+            self._ddl_cache[key] = fetch()
+        return self._ddl_cache[key]
+    
+    def _buffer_log_row(self, row):
+        # Log rows are written by a background thread on its own connection,
+        # so workers never wait on a sync_log insert or commit
+        with self._log_lock:
+            if self._log_thread is None:
+                self._log_thread = threading.Thread(target=self._log_writer, name=f"aquifer-log-{id(self)}", daemon=True)
+                self._log_thread.start()
+            self._log_queue.put(row)
+    
+    def flush_log(self):
+        # Waits for every queued row to be written and stops the writer; the
+        # next logged row starts a new one
+        with self._log_lock:
+            if self._log_thread is not None:
+                self._log_queue.put(_LOG_STOP)
+                self._log_thread.join()
+                self._log_thread = None
+    
+    def _log_writer(self):
+        try:
+            with self._log_connection() as conn:
+                while True:
+                    rows = [self._log_queue.get()]
+                    while len(rows) < LOG_FLUSH_SIZE:
+                        try:
+                            rows.append(self._log_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    # flush_log queues the stop marker last
+                    stop = rows[-1] is _LOG_STOP
+                    if stop:
+                        rows.pop()
+                    if rows:
+                        self._write_log_rows(conn, rows)
+                    if stop:
+                        return
+        except Exception as e:
+            logging.error("Error in sync log writer: %s", e)
+    
+    def _log_connection(self):
+        return self._borrow()
+    
+    @abstractmethod
+    def _write_log_rows(self, conn, rows):
+        pass
+    
+    def _load_last_hashes(self, object_type):
+        # Latest logged DDL hash per object, used to skip objects already in sync
+        self.cursor.execute(f"""
+            SELECT l.object_name, l.ddl_hash
+            FROM sync_log l
+            JOIN (
+                SELECT object_type, object_name, MAX(timestamp) AS last_ts
+                FROM sync_log
+                WHERE object_type = {self.LOG_PARAM}
+                GROUP BY object_type, object_name
+            ) latest ON latest.object_type = l.object_type AND latest.object_name = l.object_name AND latest.last_ts = l.timestamp
+        """, (object_type,))
+        return {name: ddl_hash for name, ddl_hash in self.cursor.fetchall() if ddl_hash is not None}
+    
+    def _unchanged_since_last_sync(self, object_type, name, source_definition):
+        # Skips the comparison for objects whose source DDL is what was last
+        # written to this target; callers only ask for objects that exist there
+        last = self._last_hash.get(object_type)
+        if last is None or source_definition is None:
+            return False
+        return last.get(name) == _ddl_hash(source_definition)
+    
+    def _acquire_object_lock(self, cursor, key):
+        return True
+    
+    def _release_object_lock(self, cursor, key):
+        pass
+    
+    def _invalidate_cached_definition(self, object_type, name, action):
+        if action not in ("create", "sync", "drop", "rollback"):
+            return
+        last = self._last_hash.get(object_type)
+        if last is not None:
+            last.pop(name, None)
+        self._ddl_cache.pop((object_type, name), None)
+        if action == "rollback":
+            return
+        existing = {"table": self._existing_tables, "view": self._existing_views, "procedure": self._existing_procedures}.get(object_type)
+        if existing is not None:
+            if action == "drop":
+                existing.discard(name)
+            else:
+                existing.add(name)
+    
+    def _iter_sync_all(self, sync_method, names, alter_sync, source_code_hash, create_on_target, source_states=None, target_states=None, state_args=("original_state", "target_state")):
+        # Each object is synchronized on its own pooled connection so that
+        # introspection and DDL round-trips overlap across objects. Prefetched
+        # DDL is handed to the worker so it doesn't have to query it again.
+        # Names are yielded as their workers finish, so a caller can start on
+        # dependent work for an object while the others are still running.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for name in names:
+                states = {}
+                if source_states is not None:
+                    states[state_args[0]] = source_states.get(name)
+                if target_states is not None:
+                    states[state_args[1]] = target_states.get(name)
+                futures[executor.submit(self._sync_one, sync_method, name, alter_sync, source_code_hash, create_on_target, **states)] = name
+            for future in as_completed(futures):
+                future.result()
+                yield futures[future]
+    
+    def _sync_all(self, *args, **kwargs):
+        return list(self._iter_sync_all(*args, **kwargs))
     
     @abstractmethod
     def connect(self):
@@ -67,539 +411,1051 @@ class DatabaseSync(ABC):
         pass
     
     @abstractmethod
-    def rollback_table(self, table_name):
+    def rollback_table(self, table_name, entry=None):
         pass
     
     @abstractmethod
-    def rollback_view(self, view_name):
+    def rollback_view(self, view_name, entry=None):
         pass
     
     @abstractmethod
-    def rollback_procedure(self, procedure_name):
+    def rollback_procedure(self, procedure_name, entry=None):
         pass
+    
+    def _placeholders(self, count):
+        return [self.LOG_PARAM] * count
+    
+    def _last_log_entries(self, items):
+        # Latest (original_state, action) for every requested object in one
+        # query rather than one lookup per object
+        entries = dict.fromkeys(items, (None, None))
+        if not entries:
+            return entries
+        placeholders = iter(self._placeholders(2 * len(entries)))
+        conditions = " OR ".join(f"(object_type = {next(placeholders)} AND object_name = {next(placeholders)})" for _ in entries)
+        params = [value for item in entries for value in item]
+        self.cursor.execute(f"""
+            SELECT object_type, object_name, original_state, action FROM (
+                SELECT object_type, object_name, original_state, action,
+                       ROW_NUMBER() OVER (PARTITION BY object_type, object_name ORDER BY timestamp DESC) AS rn
+                FROM sync_log
+                WHERE {conditions}
+            ) latest WHERE rn = 1
+        """, params)
+        for object_type, object_name, original_state, action in self.cursor.fetchall():
+            entries[(object_type, object_name)] = (original_state, action)
+        return entries
+    
+    def _queue_ddl(self, *statements, on_success=None):
+        # Inside transaction() statements are collected rather than run, and
+        # on_success waits until the whole batch has been committed
+        if self._batch is not None:
+            self._batch.extend(statements)
+            if on_success is not None:
+                self._batch_callbacks.append(on_success)
+            return True
+        if self._execute_ddl(self.cursor, *statements):
+            self.conn.commit()
+            if on_success is not None:
+                on_success()
+            return True
+        return False
+    
+    @contextmanager
+    def transaction(self):
+        # DDL queued in the block is sent as one _execute_ddl batch and
+        # committed once, rather than a round-trip and commit per statement
+        self._batch, self._batch_callbacks = [], []
+        try:
+            yield
+        finally:
+            batch, self._batch = self._batch, None
+            callbacks, self._batch_callbacks = self._batch_callbacks, None
+        if batch and self._execute_ddl(self.cursor, *batch):
+            self.conn.commit()
+            for callback in callbacks:
+                callback()
+    
+    def _record_rollback(self, object_type, name, restored_state):
+        if restored_state is None:
+            logging.info("Dropped %s %s as part of rollback.", object_type, name)
+        else:
+            logging.info("Rolled back %s %s to its original state using: %s", object_type, name, restored_state)
+        # Logged so the next sync compares against what the target now holds
+        # instead of skipping on the hash of the rolled back definition
+        self.log_sync_action(object_type, name, "rollback", _SOURCE_HASH, "rollback", None, restored_state, None)
+    
+    def rollback_objects(self, items):
+        try:
+            entries = self._last_log_entries(items)
+        except self._drv.Error as e:
+            logging.error("Error reading sync_log for rollback: %s", e)
+            return
+        with self.transaction():
+            for object_type, object_name in items:
+                method = self.ROLLBACK_METHODS.get(object_type)
+                if method is None:
+                    logging.error("Unsupported rollback object type: %s", object_type)
+                    continue
+                getattr(self, method)(object_name, entries.get((object_type, object_name)))
 
 class MySQLSync(DatabaseSync):
+    SYNC_LOG_DDL = """
+        CREATE TABLE IF NOT EXISTS sync_log (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            object_type VARCHAR(32) NOT NULL,
+            object_name VARCHAR(255) NOT NULL,
+            action VARCHAR(32) NOT NULL,
+            source_code_hash VARCHAR(64),
+            sync_direction VARCHAR(32),
+            original_state LONGTEXT,
+            new_state LONGTEXT,
+            rollback_action VARCHAR(32),
+            ddl_hash BIGINT,
+            timestamp TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+            INDEX idx_sync_log_lookup (object_type, object_name, timestamp DESC)
+        )
+    """
+    SQL_TEMPLATES = {
+        "show_create_table": "SHOW CREATE TABLE {}",
+        "show_create_view": "SHOW CREATE VIEW {}",
+        "show_create_procedure": "SHOW CREATE PROCEDURE {}",
+        "drop_table": "DROP TABLE IF EXISTS {}",
+        "drop_view": "DROP VIEW IF EXISTS {}",
+        "drop_procedure": "DROP PROCEDURE IF EXISTS {}",
+        "create_index": "CREATE {}INDEX {} ON {} ({})",
+    }
+    LIST_OBJECTS_SQL = {
+        "table": "SELECT table_name FROM information_schema.tables WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE'",
+        "view": "SELECT table_name FROM information_schema.views WHERE table_schema = DATABASE()",
+        "procedure": "SELECT routine_name FROM information_schema.routines WHERE routine_schema = DATABASE() AND routine_type = 'PROCEDURE'",
+    }
+
     def connect(self):
+        import mysql.connector
+        import mysql.connector.pooling
+        self._drv = mysql.connector
         try:
-            self.conn = mysql.connector.connect(**self.config)
+            # One more than twice the workers for the sync_log writer
+            pool_size = min(2 * self.max_workers + 1, mysql.connector.pooling.CNX_POOL_MAXSIZE)
+            self.pool = _shared_pool(self._pool_key(pool_size), lambda: self._create_pool(pool_size))
+            # The main connection keeps its slot until close()
+            self.pool.slots.acquire()
+            self.conn = self.pool.get_connection()
             self.cursor = self.conn.cursor()
-        except MySQLError as e:
-            logging.error(f"Error connecting to MySQL: {e}")
+            self.cursor.execute(self.SYNC_LOG_DDL)
+            # Server-side prepared once and reused by every rollback lookup
+            self._lookup_cursor = self.conn.cursor(prepared=True)
+        except self._drv.Error as e:
+            logging.error("Error connecting to MySQL: %s", e)
             raise
     
     def close(self):
+        self.flush_log()
+        self._lookup_cursor.close()
         self.cursor.close()
         self.conn.close()
+        self.pool.slots.release()
+    
+    def _create_pool(self, size):
+        pool = self._drv.pooling.MySQLConnectionPool(pool_name=f"aquifer_{len(_POOLS)}", pool_size=size, **self.config)
+        # get_connection() raises as soon as the pool is empty, and the pool
+        # can't grow past CNX_POOL_MAXSIZE; borrowers wait for a slot instead
+        pool.slots = threading.BoundedSemaphore(size)
+        return pool
+    
+    @contextmanager
+    def _borrow(self):
+        with self.pool.slots:
+            conn = self.pool.get_connection()
+            try:
+                yield conn
+            finally:
+                conn.close()
+    
+    def _sync_one(self, sync_method, name, alter_sync, source_code_hash, create_on_target, **kwargs):
+        with self._borrow() as conn:
+            cursor = conn.cursor()
+            try:
+                sync_method(name, alter_sync, source_code_hash, create_on_target, cursor=cursor, **kwargs)
+            finally:
+                cursor.close()
     
     def log_sync_action(self, object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action):
+        self._invalidate_cached_definition(object_type, object_name, action)
+        self._buffer_log_row((object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action, _ddl_hash(new_state)))
+    
+    def _write_log_rows(self, conn, rows):
+        cursor = conn.cursor()
         try:
-            self.cursor.execute("""
-                INSERT INTO sync_log (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """, (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action))
-            self.conn.commit()
-        except MySQLError as e:
-            logging.error(f"Error logging sync action: {e}")
+            cursor.executemany("""
+                INSERT INTO sync_log (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action, ddl_hash)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, rows)
+            conn.commit()
+        except self._drv.Error as e:
+            logging.error("Error logging sync actions: %s", e)
+        finally:
+            cursor.close()
     
-    def test_sql_statement(self, statement):
+    def iter_objects(self, object_type):
+        with self._borrow() as conn:
+            cursor = conn.cursor(buffered=False)
+            try:
+                cursor.execute(self.LIST_OBJECTS_SQL[object_type])
+                for row in cursor:
+                    yield row[0]
+            finally:
+                cursor.close()
+    
+    def _last_log_entry(self, object_type, object_name):
+        self._lookup_cursor.execute("SELECT /*+ INDEX(sync_log idx_sync_log_lookup) */ original_state, action FROM sync_log WHERE object_type = %s AND object_name = %s ORDER BY timestamp DESC LIMIT 1", (object_type, object_name))
+        row = self._lookup_cursor.fetchone()
+        return row if row else (None, None)
+    
+    def _execute_ddl(self, cursor, *statements):
+        # DDL commits implicitly on MySQL, so running it inside a transaction
+        # and rolling back doesn't undo anything. Validate with PREPARE, which
+        # parses without executing, and then run each statement exactly once.
         try:
-            self.cursor.execute("START TRANSACTION")
-            self.cursor.execute(statement)
-            self.cursor.execute("ROLLBACK")
+            for statement in statements:
+                try:
+                    cursor.execute("PREPARE aquifer_check FROM %s", (statement,))
+                    cursor.execute("DEALLOCATE PREPARE aquifer_check")
+                except self._drv.Error as e:
+                    # CREATE PROCEDURE and friends can't be prepared; the
+                    # server validates them as they execute instead.
+                    if e.errno != self._drv.errorcode.ER_UNSUPPORTED_PS:
+                        raise
+                cursor.execute(statement)
             return True
-        except MySQLError as e:
-            logging.error(f"Invalid SQL statement: {statement}. Error: {e}")
-            self.cursor.execute("ROLLBACK")
+        except self._drv.Error as e:
+            logging.error("Invalid SQL statement: %s. Error: %s", statement, e)
             return False
 
-    def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target):
+    def _lock_name(self, key):
+        # GET_LOCK names are limited to 64 characters
+        if len(key) > 64:
+            key = "aquifer:" + hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return key
+
+    def _acquire_object_lock(self, cursor, key):
+        try:
+            cursor.execute("SELECT GET_LOCK(%s, 0)", (self._lock_name(key),))
+            return cursor.fetchone()[0] == 1
+        except self._drv.Error as e:
+            logging.error("Error acquiring lock %s: %s", key, e)
+            return False
+
+    def _release_object_lock(self, cursor, key):
+        try:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (self._lock_name(key),))
+            cursor.fetchone()
+        except self._drv.Error as e:
+            logging.error("Error releasing lock %s: %s", key, e)
+
+    def _table_change_times(self):
+        try:
+            # information_schema statistics are cached for a day by default on 8.0
+            self.cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+        except self._drv.Error:
+            pass
+        self.cursor.execute("""
+            SELECT table_name, UNIX_TIMESTAMP(GREATEST(create_time, COALESCE(update_time, create_time)))
+            FROM information_schema.tables
+            WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE'
+        """)
+        return dict(self.cursor.fetchall())
+
+    def _load_last_sync_times(self, object_type):
+        # A rollback undoes a sync rather than being one
+        self.cursor.execute("SELECT object_name, UNIX_TIMESTAMP(MAX(timestamp)) FROM sync_log WHERE object_type = %s AND action <> 'rollback' GROUP BY object_name", (object_type,))
+        return dict(self.cursor.fetchall())
+
+    def get_table_definition(self, table, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+
+        def fetch():
+            try:
+                cursor.execute(self.SQL_TEMPLATES["show_create_table"].format(_quote_mysql_identifier(table)))
+            except self._drv.Error as e:
+                if e.errno == self._drv.errorcode.ER_NO_SUCH_TABLE:
+                    return None
+                raise
+            row = cursor.fetchone()
+            return row[1] if row else None
+        return self._cached_definition("table", table, fetch)
+
+    def get_view_definition(self, view_name, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+
+        def fetch():
+            try:
+                cursor.execute(self.SQL_TEMPLATES["show_create_view"].format(_quote_mysql_identifier(view_name)))
+            except self._drv.Error as e:
+                if e.errno == self._drv.errorcode.ER_NO_SUCH_TABLE:
+                    return None
+                raise
+            row = cursor.fetchone()
+            return row[1] if row else None
+        return self._cached_definition("view", view_name, fetch)
+
+    def get_procedure_definition(self, procedure_name, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+
+        def fetch():
+            try:
+                cursor.execute(self.SQL_TEMPLATES["show_create_procedure"].format(_quote_mysql_identifier(procedure_name)))
+            except self._drv.Error as e:
+                if e.errno == self._drv.errorcode.ER_SP_DOES_NOT_EXIST:
+                    return None
+                raise
+            row = cursor.fetchone()
+            return row[2] if row else None
+        return self._cached_definition("procedure", procedure_name, fetch)
+
+    @_object_locked("table")
+    def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target, cursor=None, original_state=None, target_state=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
             # Retrieve original state from source
-            self.cursor.execute(f"SHOW CREATE TABLE {table}")
-            original_state = self.cursor.fetchone()
-            original_state = original_state[1] if original_state else None
+            if original_state is None:
+                original_state = self._source_definition("table", table, cursor)
+            if original_state is None:
+                logging.warning("Table %s not found on source. Skipping.", table)
+                return
+
+            source_hash = _ddl_hash(original_state)
 
             # Synchronization logic
-            self.cursor.execute(f"SHOW TABLES LIKE '{table}'")
-            target_exists = bool(self.cursor.fetchone())
+            if target_state is None:
+                target_state = self.get_table_definition(table, cursor)
+            target_exists = target_state is not None
 
             if not target_exists:
                 if create_on_target:
-                    logging.info(f"Table {table} doesn't exist on target. Creating...")
-                    if self.test_sql_statement(original_state):
-                        self.cursor.execute(original_state)
+                    logging.info("Table %s doesn't exist on target. Creating...", table)
+                    if self._execute_ddl(cursor, original_state):
                         new_state = original_state
-                        logging.info(f"Table {table} created successfully on target.")
+                        logging.info("Table %s created successfully on target.", table)
                         self.log_sync_action("table", table, "create", source_code_hash, "source_to_target", None, new_state, "drop")
                 return
 
-            # If the table exists on the target
-            self.cursor.execute(f"SHOW CREATE TABLE {table}")
-            target_state = self.cursor.fetchone()
-            target_state = target_state[1] if target_state else None
-
-            if original_state != target_state:
-                logging.info(f"Synchronizing table: {table}")
+            if source_hash != _ddl_hash(target_state):
+                logging.info("Synchronizing table: %s", table)
                 if alter_sync:
                     # Implement the logic for ALTER statements if required
                     pass
                 else:
-                    self.cursor.execute(f"DROP TABLE IF EXISTS {table}")
-                    if self.test_sql_statement(original_state):
-                        self.cursor.execute(original_state)
+                    cursor.execute(self.SQL_TEMPLATES["drop_table"].format(_quote_mysql_identifier(table)))
+                    if self._execute_ddl(cursor, original_state):
                         new_state = original_state
-                        logging.info(f"Table {table} synchronized successfully.")
+                        logging.info("Table %s synchronized successfully.", table)
                         self.log_sync_action("table", table, "sync", source_code_hash, "source_to_target", target_state, new_state, "drop")
             else:
-                logging.info(f"Table {table} is already synchronized.")
-        except MySQLError as e:
-            logging.error(f"Error synchronizing table {table}: {e}")
-
-    def synchronize_view(self, view_name, alter_sync, source_code_hash, create_on_target):
+                logging.info("Table %s is already synchronized.", table)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing table %s: %s", table, e)
+
+    @_object_locked("view")
+    def synchronize_view(self, view_name, alter_sync, source_code_hash, create_on_target, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            source_definition = self.get_view_definition(view_name)
-            self.cursor.execute(f"SHOW CREATE VIEW {view_name}")
-            original_state = self.cursor.fetchone()
-            original_state = original_state[1] if original_state else None
+            source_definition = self._source_definition("view", view_name, cursor)
+            if source_definition is None:
+                logging.warning("View %s not found on source. Skipping.", view_name)
+                return
+            if self._existing_views is not None and view_name in self._existing_views and self._unchanged_since_last_sync("view", view_name, source_definition):
+                logging.info("View %s is unchanged since its last sync.", view_name)
+                return
 
-            self.cursor.execute(f"SHOW FULL TABLES WHERE Table_type = 'VIEW' LIKE '{view_name}'")
-            target_exists = bool(self.cursor.fetchone())
+            # The target definition doubles as the existence check
+            if self._existing_views is not None and view_name not in self._existing_views:
+                original_state = None
+            else:
+                original_state = self.get_view_definition(view_name, cursor)
+            target_exists = original_state is not None
 
-            if not target_exists and create_on_target:
-                logging.info(f"View {view_name} doesn't exist on target. Creating...")
-                
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
-                    new_state = source_definition
-                    logging.info(f"View {view_name} created successfully on target.")
-                    self.log_sync_action("view", view_name, "create", source_code_hash, "source_to_target", original_state, new_state, "drop")
+            if not target_exists:
+                if create_on_target:
+                    logging.info("View %s doesn't exist on target. Creating...", view_name)
+
+                    if self._execute_ddl(cursor, source_definition):
+                        new_state = source_definition
+                        logging.info("View %s created successfully on target.", view_name)
+                        self.log_sync_action("view", view_name, "create", source_code_hash, "source_to_target", original_state, new_state, "drop")
                 return
 
-            if source_definition != original_state:
-                logging.info(f"Synchronizing view: {view_name}")
-                self.cursor.execute(f"DROP VIEW IF EXISTS {view_name}")
+            if not _same_ddl(source_definition, original_state):
+                logging.info("Synchronizing view: %s", view_name)
+                cursor.execute(self.SQL_TEMPLATES["drop_view"].format(_quote_mysql_identifier(view_name)))
                 
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
+                if self._execute_ddl(cursor, source_definition):
                     new_state = source_definition
-                    logging.info(f"View {view_name} synchronized successfully.")
+                    logging.info("View %s synchronized successfully.", view_name)
                     self.log_sync_action("view", view_name, "sync", source_code_hash, "source_to_target", original_state, new_state, "drop")
             else:
-                logging.info(f"View {view_name} is already synchronized.")
-        except MySQLError as e:
-            logging.error(f"Error synchronizing view {view_name}: {e}")
-
-    def synchronize_procedure(self, procedure_name, alter_sync, source_code_hash, create_on_target):
+                logging.info("View %s is already synchronized.", view_name)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing view %s: %s", view_name, e)
+
+    @_object_locked("procedure")
+    def synchronize_procedure(self, procedure_name, alter_sync, source_code_hash, create_on_target, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            source_definition = self.get_procedure_definition(procedure_name)
+            source_definition = self._source_definition("procedure", procedure_name, cursor)
+            if source_definition is None:
+                logging.warning("Procedure %s not found on source. Skipping.", procedure_name)
+                return
+            if self._existing_procedures is not None and procedure_name in self._existing_procedures and self._unchanged_since_last_sync("procedure", procedure_name, source_definition):
+                logging.info("Procedure %s is unchanged since its last sync.", procedure_name)
+                return
 
-            self.cursor.execute(f"SHOW PROCEDURE STATUS WHERE Db = DATABASE() AND Name = '{procedure_name}'")
-            target_exists = bool(self.cursor.fetchone())
+            # The target definition doubles as the existence check
+            if self._existing_procedures is not None and procedure_name not in self._existing_procedures:
+                target_definition = None
+            else:
+                target_definition = self.get_procedure_definition(procedure_name, cursor)
+            target_exists = target_definition is not None
 
             if not target_exists or create_on_target:
                 if not target_exists:
-                    logging.info(f"Procedure {procedure_name} doesn't exist on target. Creating...")
+                    logging.info("Procedure %s doesn't exist on target. Creating...", procedure_name)
                 else:
-                    logging.info(f"Procedure {procedure_name} creation is not disabled. Creating...")
+                    logging.info("Procedure %s creation is not disabled. Creating...", procedure_name)
 
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
+                if self._execute_ddl(cursor, source_definition):
                     new_state = source_definition
-                    logging.info(f"Procedure {procedure_name} created successfully on target.")
+                    logging.info("Procedure %s created successfully on target.", procedure_name)
                     self.log_sync_action("procedure", procedure_name, "create", source_code_hash, "source_to_target", None, new_state, "drop")
                 return
 
             if target_exists:
-                target_definition = self.get_procedure_definition(procedure_name)
                 original_state = target_definition
 
-                if source_definition != target_definition:
-                    logging.info(f"Synchronizing procedure: {procedure_name}")
-                    self.cursor.execute(f"DROP PROCEDURE IF EXISTS {procedure_name}")
+                if not _same_ddl(source_definition, target_definition):
+                    logging.info("Synchronizing procedure: %s", procedure_name)
+                    cursor.execute(self.SQL_TEMPLATES["drop_procedure"].format(_quote_mysql_identifier(procedure_name)))
                     
-                    if self.test_sql_statement(source_definition):
-                        self.cursor.execute(source_definition)
+                    if self._execute_ddl(cursor, source_definition):
                         new_state = source_definition
-                        logging.info(f"Procedure {procedure_name} synchronized successfully.")
+                        logging.info("Procedure %s synchronized successfully.", procedure_name)
                         self.log_sync_action("procedure", procedure_name, "sync", source_code_hash, "source_to_target", original_state, new_state, "drop")
                 else:
-                    logging.info(f"Procedure {procedure_name} is already synchronized.")
-        except MySQLError as e:
-            logging.error(f"Error synchronizing procedure {procedure_name}: {e}")
+                    logging.info("Procedure %s is already synchronized.", procedure_name)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing procedure %s: %s", procedure_name, e)
 
     def synchronize_all_tables(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SHOW TABLES")
-            tables_to_sync = [table[0] for table in self.cursor.fetchall()]
-
-            for table in tables_to_sync:
-                self.synchronize_table(table, alter_sync, source_code_hash, create_on_target)
-        except MySQLError as e:
-            logging.error(f"Error synchronizing all tables: {e}")
+            self._all_indexes = None
+            unmodified = self._unmodified_tables()
+            # SHOW CREATE TABLE can't be batched, so only names are listed up
+            # front; each worker fetches its table's DDL on its own connection
+            target_tables = set(self.list_objects("table"))
+            return self._sync_all(self.synchronize_table, self._tables_to_sync(target_tables, unmodified), alter_sync, source_code_hash, create_on_target)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all tables: %s", e)
+            return []
+
+    def _tables_to_sync(self, target_tables, skip):
+        for table in self._source_names("table", target_tables):
+            if table in skip:
+                continue
+            # Known to be missing, so workers don't probe the target for it
+            if table not in target_tables:
+                self._ddl_cache.setdefault(("table", table), None)
+            yield table
 
     def synchronize_all_views(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SHOW FULL TABLES WHERE Table_type = 'VIEW'")
-            views_to_sync = [view[0] for view in self.cursor.fetchall()]
+            self._last_hash["view"] = self._load_last_hashes("view")
+            self._existing_views = set(self.list_objects("view"))
+            views_to_sync = self._source_names("view", self._existing_views)
 
-            for view in views_to_sync:
-                self.synchronize_view(view, alter_sync, source_code_hash, create_on_target)
-        except MySQLError as e:
-            logging.error(f"Error synchronizing all views: {e}")
+            self._sync_all(self.synchronize_view, views_to_sync, alter_sync, source_code_hash, create_on_target)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all views: %s", e)
 
     def synchronize_all_procedures(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SHOW PROCEDURE STATUS WHERE Db = DATABASE()")
-            procedures_to_sync = [proc[1] for proc in self.cursor.fetchall()]
-
-            for procedure in procedures_to_sync:
-                self.synchronize_procedure(procedure, alter_sync, source_code_hash, create_on_target)
-        except MySQLError as e:
-            logging.error(f"Error synchronizing all procedures: {e}")
+            self._last_hash["procedure"] = self._load_last_hashes("procedure")
+            self._existing_procedures = set(self.list_objects("procedure"))
+            procedures_to_sync = self._source_names("procedure", self._existing_procedures)
+
+            self._sync_all(self.synchronize_procedure, procedures_to_sync, alter_sync, source_code_hash, create_on_target)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all procedures: %s", e)
+
+    def _load_all_indexes(self):
+        self.cursor.execute("""
+            SELECT table_name, index_name, non_unique, index_type, column_name, sub_part
+            FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND index_name <> 'PRIMARY'
+            ORDER BY table_name, index_name, seq_in_index
+        """)
+        columns = {}
+        kinds = {}
+        for table, index_name, non_unique, index_type, column, sub_part in self.cursor.fetchall():
+            key = (table, index_name)
+            kinds[key] = {"FULLTEXT": "FULLTEXT ", "SPATIAL": "SPATIAL "}.get(index_type, "" if non_unique else "UNIQUE ")
+            if column is None or columns.get(key, []) is None:
+                # Functional key parts can't be rebuilt from the column list
+                columns[key] = None
+                continue
+            part = _quote_mysql_identifier(column)
+            columns.setdefault(key, []).append(f"{part}({sub_part})" if sub_part else part)
+
+        all_indexes = {}
+        for (table, index_name), parts in columns.items():
+            if parts is None:
+                continue
+            statement = self.SQL_TEMPLATES["create_index"].format(kinds[table, index_name], _quote_mysql_identifier(index_name), _quote_mysql_identifier(table), ", ".join(parts))
+            all_indexes.setdefault(table, []).append((index_name, statement))
+        return all_indexes
 
     def synchronize_indexes(self, table):
         try:
-            self.cursor.execute(f"SHOW INDEXES FROM {table}")
-            indexes = self.cursor.fetchall()
-            for index in indexes:
-                if index[2] != 'PRIMARY':
-                    create_index_statement = f"CREATE INDEX {index[2]} ON {table} ({index[4]})"
-                    logging.info(f"Creating index: {create_index_statement}")
-                    if self.test_sql_statement(create_index_statement):
-                        self.cursor.execute(create_index_statement)
-        except MySQLError as e:
-            logging.error(f"Error synchronizing indexes for table {table}: {e}")
-
-    def rollback_table(self, table_name):
+            statements = self._missing_index_statements(table)
+            for statement in statements:
+                logging.info("Creating index: %s", statement)
+            if statements:
+                self._execute_ddl(self.cursor, *statements)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing indexes for table %s: %s", table, e)
+
+    def rollback_table(self, table_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='table' AND object_name=%s ORDER BY timestamp DESC LIMIT 1", (table_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("table", table_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-                logging.info(f"Dropped table {table_name} as part of rollback.")
+                self.cursor.execute(self.SQL_TEMPLATES["drop_table"].format(_quote_mysql_identifier(table_name)))
+                self._record_rollback("table", table_name, None)
             elif action == 'alter' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back table {table_name} to its original state using: {original_state}")
+                if self._execute_ddl(self.cursor, original_state):
+                    self._record_rollback("table", table_name, original_state)
             else:
-                logging.warning(f"No rollback action found for table {table_name}.")
-        except MySQLError as e:
-            logging.error(f"Error rolling back table {table_name}: {e}")
+                logging.warning("No rollback action found for table %s.", table_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back table %s: %s", table_name, e)
 
-    def rollback_view(self, view_name):
+    def rollback_view(self, view_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='view' AND object_name=%s ORDER BY timestamp DESC LIMIT 1", (view_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("view", view_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP VIEW IF EXISTS {view_name}")
-                logging.info(f"Dropped view {view_name} as part of rollback.")
+                self.cursor.execute(self.SQL_TEMPLATES["drop_view"].format(_quote_mysql_identifier(view_name)))
+                self._record_rollback("view", view_name, None)
             elif action == 'sync' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back view {view_name} to its original state using: {original_state}")
+                if self._execute_ddl(self.cursor, original_state):
+                    self._record_rollback("view", view_name, original_state)
             else:
-                logging.warning(f"No rollback action found for view {view_name}.")
-        except MySQLError as e:
-            logging.error(f"Error rolling back view {view_name}: {e}")
+                logging.warning("No rollback action found for view %s.", view_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back view %s: %s", view_name, e)
 
-    def rollback_procedure(self, procedure_name):
+    def rollback_procedure(self, procedure_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='procedure' AND object_name=%s ORDER BY timestamp DESC LIMIT 1", (procedure_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("procedure", procedure_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP PROCEDURE IF EXISTS {procedure_name}")
-                logging.info(f"Dropped procedure {procedure_name} as part of rollback.")
+                self.cursor.execute(self.SQL_TEMPLATES["drop_procedure"].format(_quote_mysql_identifier(procedure_name)))
+                self._record_rollback("procedure", procedure_name, None)
             elif action == 'sync' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back procedure {procedure_name} to its original state using: {original_state}")
+                if self._execute_ddl(self.cursor, original_state):
+                    self._record_rollback("procedure", procedure_name, original_state)
             else:
-                logging.warning(f"No rollback action found for procedure {procedure_name}.")
-        except MySQLError as e:
-            logging.error(f"Error rolling back procedure {procedure_name}: {e}")
+                logging.warning("No rollback action found for procedure %s.", procedure_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back procedure %s: %s", procedure_name, e)
 
 class PostgreSQLSync(DatabaseSync):
+    SYNC_LOG_DDL = """
+        CREATE TABLE IF NOT EXISTS sync_log (
+            id BIGSERIAL PRIMARY KEY,
+            object_type VARCHAR(32) NOT NULL,
+            object_name VARCHAR(255) NOT NULL,
+            action VARCHAR(32) NOT NULL,
+            source_code_hash VARCHAR(64),
+            sync_direction VARCHAR(32),
+            original_state TEXT,
+            new_state TEXT,
+            rollback_action VARCHAR(32),
+            ddl_hash BIGINT,
+            timestamp TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+        -- original_state can exceed the btree tuple limit, so only action is included
+        CREATE INDEX IF NOT EXISTS idx_sync_log_lookup ON sync_log (object_type, object_name, timestamp DESC) INCLUDE (action);
+    """
+    SQL_TEMPLATES = {
+        "create_view": "CREATE OR REPLACE VIEW {} AS ",
+        "drop_table": "DROP TABLE IF EXISTS {}",
+        "drop_view": "DROP VIEW IF EXISTS {}",
+        "drop_procedure": "DROP PROCEDURE IF EXISTS {}",
+    }
+    LIST_OBJECTS_SQL = {
+        "table": "SELECT tablename FROM pg_tables WHERE schemaname = 'public'",
+        "view": "SELECT viewname FROM pg_views WHERE schemaname = 'public'",
+        "procedure": "SELECT proname FROM pg_proc WHERE pronamespace = (SELECT oid FROM pg_namespace WHERE nspname = 'public')",
+    }
+
     def connect(self):
+        import psycopg2
+        import psycopg2.pool
+        import psycopg2.sql
+        self._drv = psycopg2
+        self._templates = {name: psycopg2.sql.SQL(template) for name, template in self.SQL_TEMPLATES.items()}
         try:
-            self.conn = psycopg2.connect(**self.config)
+            # One more than twice the workers for the sync_log writer
+            pool_size = 2 * self.max_workers + 1
+            self.pool = _shared_pool(self._pool_key(pool_size), lambda: psycopg2.pool.ThreadedConnectionPool(1, pool_size, **self.config))
+            self.conn = self.pool.getconn()
             self.cursor = self.conn.cursor()
-        except PGError as e:
-            logging.error(f"Error connecting to PostgreSQL: {e}")
+            self.cursor.execute(self.SYNC_LOG_DDL)
+            # Prepared statements live as long as the session, and pooled
+            # sessions outlive this instance, so only the first borrower prepares
+            self.cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = 'sync_log_last'")
+            if self.cursor.fetchone() is None:
+                self.cursor.execute("""
+                    PREPARE sync_log_last (text, text) AS
+                    SELECT original_state, action FROM sync_log
+                    WHERE object_type = $1 AND object_name = $2
+                    ORDER BY timestamp DESC LIMIT 1
+                """)
+            self.conn.commit()
+        except self._drv.Error as e:
+            logging.error("Error connecting to PostgreSQL: %s", e)
             raise
     
     def close(self):
+        self.flush_log()
         self.cursor.close()
-        self.conn.close()
+        self.pool.putconn(self.conn)
+    
+    @contextmanager
+    def _borrow(self):
+        conn = self.pool.getconn()
+        try:
+            yield conn
+        finally:
+            self.pool.putconn(conn)
+    
+    def _sync_one(self, sync_method, name, alter_sync, source_code_hash, create_on_target, **kwargs):
+        with self._borrow() as conn:
+            cursor = conn.cursor()
+            try:
+                sync_method(name, alter_sync, source_code_hash, create_on_target, cursor=cursor, **kwargs)
+                conn.commit()
+            finally:
+                cursor.close()
     
     def log_sync_action(self, object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action):
+        self._invalidate_cached_definition(object_type, object_name, action)
+        self._buffer_log_row((object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action, _ddl_hash(new_state)))
+    
+    def _write_log_rows(self, conn, rows):
+        import psycopg2.extras
+        cursor = conn.cursor()
         try:
-            self.cursor.execute("""
-                INSERT INTO sync_log (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """, (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action))
-            self.conn.commit()
-        except PGError as e:
-            logging.error(f"Error logging sync action: {e}")
+            psycopg2.extras.execute_values(cursor, """
+                INSERT INTO sync_log (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action, ddl_hash)
+                VALUES %s
+            """, rows, page_size=LOG_FLUSH_SIZE)
+            conn.commit()
+        except self._drv.Error as e:
+            conn.rollback()
+            logging.error("Error logging sync actions: %s", e)
+        finally:
+            cursor.close()
+    
+    def iter_objects(self, object_type):
+        with self._borrow() as conn:
+            with conn.cursor(name=f"aquifer_{object_type}_stream") as cursor:
+                cursor.itersize = STREAM_BATCH_SIZE
+                cursor.execute(self.LIST_OBJECTS_SQL[object_type])
+                for row in cursor:
+                    yield row[0]
+            conn.commit()
     
-    def test_sql_statement(self, statement):
+    def _last_log_entry(self, object_type, object_name):
+        self.cursor.execute("EXECUTE sync_log_last (%s, %s)", (object_type, object_name))
+        row = self.cursor.fetchone()
+        return row if row else (None, None)
+    
+    def _execute_pipeline(self, cursor, statements):
+        # psycopg2 has no libpq pipeline mode; sending the statements as one
+        # multi-statement query still gets them to the server in a single flight.
+        cursor.execute(";\n".join(statements))
+
+    def _execute_ddl(self, cursor, *statements):
+        # PostgreSQL DDL is transactional: run it once inside a savepoint and
+        # roll back to the savepoint on failure instead of probing it first.
         try:
-            self.cursor.execute("BEGIN")
-            self.cursor.execute(statement)
-            self.cursor.execute("ROLLBACK")
+            self._execute_pipeline(cursor, ["SAVEPOINT sp_sync", *statements, "RELEASE SAVEPOINT sp_sync"])
             return True
-        except PGError as e:
-            logging.error(f"Invalid SQL statement: {statement}. Error: {e}")
-            self.cursor.execute("ROLLBACK")
+        except self._drv.Error as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT sp_sync")
+            logging.error("Invalid SQL statement: %s. Error: %s", ';'.join(statements), e)
             return False
 
-    def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target):
+    def _queue_ddl(self, *statements, on_success=None):
+        # Composed identifiers are rendered so batches can be joined as text
+        return super()._queue_ddl(*(statement if isinstance(statement, str) else statement.as_string(self.conn) for statement in statements), on_success=on_success)
+    
+    def _load_all_table_ddl(self, skip=()):
+        self.cursor.execute("""
+            SELECT c.relname, pg_get_tabledef(c.relname::text)
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relkind = 'r' AND n.nspname = 'public' AND c.relname <> ALL(%s)
+        """, (list(skip),))
+        table_ddl = dict(self.cursor.fetchall())
+        self._ddl_cache.update((("table", table), ddl) for table, ddl in table_ddl.items())
+        return table_ddl
+
+    def _table_change_times(self):
+        # DDL rewrites the table's pg_class row, so the commit time of its xmin
+        # is the last schema change. This needs track_commit_timestamp.
+        self.cursor.execute("SHOW track_commit_timestamp")
+        if self.cursor.fetchone()[0] != "on":
+            return {}
+        self.cursor.execute("""
+            SELECT c.relname, EXTRACT(EPOCH FROM pg_xact_commit_timestamp(c.xmin))
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relkind = 'r' AND n.nspname = 'public'
+        """)
+        return dict(self.cursor.fetchall())
+
+    def _load_last_sync_times(self, object_type):
+        # A rollback undoes a sync rather than being one
+        self.cursor.execute("SELECT object_name, EXTRACT(EPOCH FROM MAX(timestamp)) FROM sync_log WHERE object_type = %s AND action <> 'rollback' GROUP BY object_name", (object_type,))
+        return dict(self.cursor.fetchall())
+
+    def _acquire_object_lock(self, cursor, key):
+        # Transaction-scoped, so it is released when the worker commits
+        try:
+            cursor.execute("SELECT pg_try_advisory_xact_lock(hashtext(%s))", (key,))
+            return cursor.fetchone()[0]
+        except self._drv.Error as e:
+            logging.error("Error acquiring lock %s: %s", key, e)
+            return False
+
+    def get_table_definition(self, table, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+
+        def fetch():
+            # Probe existence and retrieve the definition in a single round-trip
+            cursor.execute("SELECT CASE WHEN to_regclass(%s) IS NOT NULL THEN pg_get_tabledef(%s) END", (table, table))
+            return cursor.fetchone()[0]
+        return self._cached_definition("table", table, fetch)
+
+    def get_view_definition(self, view_name, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+
+        def fetch():
+            cursor.execute("SELECT pg_get_viewdef(to_regclass(%s))", (view_name,))
+            row = cursor.fetchone()
+            if not row or not row[0]:
+                return None
+            return self._templates["create_view"].format(self._drv.sql.Identifier(view_name)).as_string(cursor) + row[0]
+        return self._cached_definition("view", view_name, fetch)
+
+    def get_procedure_definition(self, procedure_name, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+
+        def fetch():
+            cursor.execute("""
+                SELECT pg_get_functiondef(p.oid)
+                FROM pg_proc p
+                JOIN pg_namespace n ON n.oid = p.pronamespace
+                WHERE n.nspname = 'public' AND p.proname = %s
+            """, (procedure_name,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+        return self._cached_definition("procedure", procedure_name, fetch)
+
+    @_object_locked("table")
+    def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target, cursor=None, original_state=None, target_state=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
             # Retrieve original state from source
-            self.cursor.execute(f"SELECT pg_get_tabledef('{table}')")
-            original_state = self.cursor.fetchone()
-            original_state = original_state[0] if original_state else None
+            if original_state is None:
+                original_state = self._source_definition("table", table, cursor)
+            if original_state is None:
+                logging.warning("Table %s not found on source. Skipping.", table)
+                return
+
+            source_hash = _ddl_hash(original_state)
 
             # Synchronization logic
-            self.cursor.execute(f"SELECT to_regclass('{table}')")
-            target_exists = bool(self.cursor.fetchone())
+            if target_state is None:
+                target_state = self.get_table_definition(table, cursor)
+            target_exists = target_state is not None
 
             if not target_exists:
                 if create_on_target:
-                    logging.info(f"Table {table} doesn't exist on target. Creating...")
-                    if self.test_sql_statement(original_state):
-                        self.cursor.execute(original_state)
+                    logging.info("Table %s doesn't exist on target. Creating...", table)
+                    if self._execute_ddl(cursor, original_state):
                         new_state = original_state
-                        logging.info(f"Table {table} created successfully on target.")
+                        logging.info("Table %s created successfully on target.", table)
                         self.log_sync_action("table", table, "create", source_code_hash, "source_to_target", None, new_state, "drop")
                 return
 
-            # If the table exists on the target
-            self.cursor.execute(f"SELECT pg_get_tabledef('{table}')")
-            target_state = self.cursor.fetchone()
-            target_state = target_state[0] if target_state else None
-
-            if original_state != target_state:
-                logging.info(f"Synchronizing table: {table}")
+            if source_hash != _ddl_hash(target_state):
+                logging.info("Synchronizing table: %s", table)
                 if alter_sync:
                     # Implement the logic for ALTER statements if required
                     pass
                 else:
-                    self.cursor.execute(f"DROP TABLE IF EXISTS {table}")
-                    if self.test_sql_statement(original_state):
-                        self.cursor.execute(original_state)
+                    statements = [self._templates["drop_table"].format(self._drv.sql.Identifier(table)).as_string(cursor), original_state]
+                    if self._execute_ddl(cursor, *statements):
                         new_state = original_state
-                        logging.info(f"Table {table} synchronized successfully.")
+                        logging.info("Table %s synchronized successfully.", table)
                         self.log_sync_action("table", table, "sync", source_code_hash, "source_to_target", target_state, new_state, "drop")
             else:
-                logging.info(f"Table {table} is already synchronized.")
-        except PGError as e:
-            logging.error(f"Error synchronizing table {table}: {e}")
-
-    def synchronize_view(self, view_name, alter_sync, source_code_hash, create_on_target):
+                logging.info("Table %s is already synchronized.", table)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing table %s: %s", table, e)
+
+    @_object_locked("view")
+    def synchronize_view(self, view_name, alter_sync, source_code_hash, create_on_target, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            source_definition = self.get_view_definition(view_name)
-            self.cursor.execute(f"SELECT pg_get_viewdef('{view_name}')")
-            original_state = self.cursor.fetchone()
-            original_state = original_state[0] if original_state else None
+            source_definition = self._source_definition("view", view_name, cursor)
+            if source_definition is None:
+                logging.warning("View %s not found on source. Skipping.", view_name)
+                return
+            if self._existing_views is not None and view_name in self._existing_views and self._unchanged_since_last_sync("view", view_name, source_definition):
+                logging.info("View %s is unchanged since its last sync.", view_name)
+                return
 
-            self.cursor.execute(f"SELECT to_regclass('{view_name}')")
-            target_exists = bool(self.cursor.fetchone())
+            # The target definition doubles as the existence check
+            if self._existing_views is not None and view_name not in self._existing_views:
+                original_state = None
+            else:
+                original_state = self.get_view_definition(view_name, cursor)
+            target_exists = original_state is not None
 
-            if not target_exists and create_on_target:
-                logging.info(f"View {view_name} doesn't exist on target. Creating...")
-                
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
-                    new_state = source_definition
-                    logging.info(f"View {view_name} created successfully on target.")
-                    self.log_sync_action("view", view_name, "create", source_code_hash, "source_to_target", original_state, new_state, "drop")
+            if not target_exists:
+                if create_on_target:
+                    logging.info("View %s doesn't exist on target. Creating...", view_name)
+
+                    if self._execute_ddl(cursor, source_definition):
+                        new_state = source_definition
+                        logging.info("View %s created successfully on target.", view_name)
+                        self.log_sync_action("view", view_name, "create", source_code_hash, "source_to_target", original_state, new_state, "drop")
                 return
 
-            if source_definition != original_state:
-                logging.info(f"Synchronizing view: {view_name}")
-                self.cursor.execute(f"DROP VIEW IF EXISTS {view_name}")
-                
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
+            if not _same_ddl(source_definition, original_state):
+                logging.info("Synchronizing view: %s", view_name)
+                statements = [self._templates["drop_view"].format(self._drv.sql.Identifier(view_name)).as_string(cursor), source_definition]
+
+                if self._execute_ddl(cursor, *statements):
                     new_state = source_definition
-                    logging.info(f"View {view_name} synchronized successfully.")
+                    logging.info("View %s synchronized successfully.", view_name)
                     self.log_sync_action("view", view_name, "sync", source_code_hash, "source_to_target", original_state, new_state, "drop")
             else:
-                logging.info(f"View {view_name} is already synchronized.")
-        except PGError as e:
-            logging.error(f"Error synchronizing view {view_name}: {e}")
-
-    def synchronize_procedure(self, procedure_name, alter_sync, source_code_hash, create_on_target):
+                logging.info("View %s is already synchronized.", view_name)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing view %s: %s", view_name, e)
+
+    @_object_locked("procedure")
+    def synchronize_procedure(self, procedure_name, alter_sync, source_code_hash, create_on_target, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            source_definition = self.get_procedure_definition(procedure_name)
+            source_definition = self._source_definition("procedure", procedure_name, cursor)
+            if source_definition is None:
+                logging.warning("Procedure %s not found on source. Skipping.", procedure_name)
+                return
+            if self._existing_procedures is not None and procedure_name in self._existing_procedures and self._unchanged_since_last_sync("procedure", procedure_name, source_definition):
+                logging.info("Procedure %s is unchanged since its last sync.", procedure_name)
+                return
 
-            self.cursor.execute(f"SELECT proname FROM pg_proc WHERE proname = '{procedure_name}'")
-            target_exists = bool(self.cursor.fetchone())
+            # The target definition doubles as the existence check
+            if self._existing_procedures is not None and procedure_name not in self._existing_procedures:
+                target_definition = None
+            else:
+                target_definition = self.get_procedure_definition(procedure_name, cursor)
+            target_exists = target_definition is not None
 
             if not target_exists or create_on_target:
                 if not target_exists:
-                    logging.info(f"Procedure {procedure_name} doesn't exist on target. Creating...")
+                    logging.info("Procedure %s doesn't exist on target. Creating...", procedure_name)
                 else:
-                    logging.info(f"Procedure {procedure_name} creation is not disabled. Creating...")
+                    logging.info("Procedure %s creation is not disabled. Creating...", procedure_name)
 
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
+                if self._execute_ddl(cursor, source_definition):
                     new_state = source_definition
-                    logging.info(f"Procedure {procedure_name} created successfully on target.")
+                    logging.info("Procedure %s created successfully on target.", procedure_name)
                     self.log_sync_action("procedure", procedure_name, "create", source_code_hash, "source_to_target", None, new_state, "drop")
                 return
 
             if target_exists:
-                target_definition = self.get_procedure_definition(procedure_name)
                 original_state = target_definition
 
-                if source_definition != target_definition:
-                    logging.info(f"Synchronizing procedure: {procedure_name}")
-                    self.cursor.execute(f"DROP PROCEDURE IF EXISTS {procedure_name}")
-                    
-                    if self.test_sql_statement(source_definition):
-                        self.cursor.execute(source_definition)
+                if not _same_ddl(source_definition, target_definition):
+                    logging.info("Synchronizing procedure: %s", procedure_name)
+                    statements = [self._templates["drop_procedure"].format(self._drv.sql.Identifier(procedure_name)).as_string(cursor), source_definition]
+
+                    if self._execute_ddl(cursor, *statements):
                         new_state = source_definition
-                        logging.info(f"Procedure {procedure_name} synchronized successfully.")
+                        logging.info("Procedure %s synchronized successfully.", procedure_name)
                         self.log_sync_action("procedure", procedure_name, "sync", source_code_hash, "source_to_target", original_state, new_state, "drop")
                 else:
-                    logging.info(f"Procedure {procedure_name} is already synchronized.")
-        except PGError as e:
-            logging.error(f"Error synchronizing procedure {procedure_name}: {e}")
+                    logging.info("Procedure %s is already synchronized.", procedure_name)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing procedure %s: %s", procedure_name, e)
 
     def synchronize_all_tables(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT tablename FROM pg_tables WHERE schemaname = 'public'")
-            tables_to_sync = [table[0] for table in self.cursor.fetchall()]
-
-            for table in tables_to_sync:
-                self.synchronize_table(table, alter_sync, source_code_hash, create_on_target)
-        except PGError as e:
-            logging.error(f"Error synchronizing all tables: {e}")
+            self._all_indexes = None
+            unmodified = self._unmodified_tables()
+            target_ddl = self._load_all_table_ddl(unmodified)
+            source_ddl = self._load_source_table_ddl(target_ddl, unmodified)
+            return self._sync_all(self.synchronize_table, list(source_ddl), alter_sync, source_code_hash, create_on_target, source_states=source_ddl, target_states=target_ddl)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all tables: %s", e)
+            return []
 
     def synchronize_all_views(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT viewname FROM pg_views WHERE schemaname = 'public'")
-            views_to_sync = [view[0] for view in self.cursor.fetchall()]
+            self._last_hash["view"] = self._load_last_hashes("view")
+            self._existing_views = set(self.list_objects("view"))
+            views_to_sync = self._source_names("view", self._existing_views)
 
-            for view in views_to_sync:
-                self.synchronize_view(view, alter_sync, source_code_hash, create_on_target)
-        except PGError as e:
-            logging.error(f"Error synchronizing all views: {e}")
+            self._sync_all(self.synchronize_view, views_to_sync, alter_sync, source_code_hash, create_on_target)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all views: %s", e)
 
     def synchronize_all_procedures(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT proname FROM pg_proc WHERE pronamespace = (SELECT oid FROM pg_namespace WHERE nspname = 'public')")
-            procedures_to_sync = [proc[0] for proc in self.cursor.fetchall()]
-
-            for procedure in procedures_to_sync:
-                self.synchronize_procedure(procedure, alter_sync, source_code_hash, create_on_target)
-        except PGError as e:
-            logging.error(f"Error synchronizing all procedures: {e}")
+            self._last_hash["procedure"] = self._load_last_hashes("procedure")
+            self._existing_procedures = set(self.list_objects("procedure"))
+            procedures_to_sync = self._source_names("procedure", self._existing_procedures)
+
+            self._sync_all(self.synchronize_procedure, procedures_to_sync, alter_sync, source_code_hash, create_on_target)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all procedures: %s", e)
+
+    def _load_all_indexes(self):
+        # Constraint-backed indexes come with the table definition
+        self.cursor.execute("""
+            SELECT t.relname, ic.relname, pg_get_indexdef(ix.indexrelid)
+            FROM pg_index ix
+            JOIN pg_class ic ON ic.oid = ix.indexrelid
+            JOIN pg_class t ON t.oid = ix.indrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname = 'public'
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindex = ix.indexrelid)
+        """)
+        all_indexes = {}
+        for table, index_name, statement in self.cursor.fetchall():
+            all_indexes.setdefault(table, []).append((index_name, statement))
+        return all_indexes
 
     def synchronize_indexes(self, table):
         try:
-            self.cursor.execute(f"""
-                SELECT indexname, indexdef 
-                FROM pg_indexes 
-                WHERE tablename = '{table}'
-            """)
-            indexes = self.cursor.fetchall()
-            for index in indexes:
-                create_index_statement = index[1]
-                logging.info(f"Creating index: {create_index_statement}")
-                if self.test_sql_statement(create_index_statement):
-                    self.cursor.execute(create_index_statement)
-        except PGError as e:
-            logging.error(f"Error synchronizing indexes for table {table}: {e}")
-
-    def rollback_table(self, table_name):
-        try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='table' AND object_name=%s ORDER BY timestamp DESC LIMIT 1", (table_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            statements = self._missing_index_statements(table)
+            for statement in statements:
+                logging.info("Creating index: %s", statement)
+            if statements and self._execute_ddl(self.cursor, *statements):
+                self.conn.commit()
+        except self._drv.Error as e:
+            logging.error("Error synchronizing indexes for table %s: %s", table, e)
+
+    def rollback_table(self, table_name, entry=None):
+        try:
+            original_state, action = entry if entry is not None else self._last_log_entry("table", table_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-                logging.info(f"Dropped table {table_name} as part of rollback.")
+                self._queue_ddl(self._templates["drop_table"].format(self._drv.sql.Identifier(table_name)), on_success=functools.partial(self._record_rollback, "table", table_name, None))
             elif action == 'alter' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back table {table_name} to its original state using: {original_state}")
+                self._queue_ddl(original_state, on_success=functools.partial(self._record_rollback, "table", table_name, original_state))
             else:
-                logging.warning(f"No rollback action found for table {table_name}.")
-        except PGError as e:
-            logging.error(f"Error rolling back table {table_name}: {e}")
+                logging.warning("No rollback action found for table %s.", table_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back table %s: %s", table_name, e)
 
-    def rollback_view(self, view_name):
+    def rollback_view(self, view_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='view' AND object_name=%s ORDER BY timestamp DESC LIMIT 1", (view_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("view", view_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP VIEW IF EXISTS {view_name}")
-                logging.info(f"Dropped view {view_name} as part of rollback.")
+                self._queue_ddl(self._templates["drop_view"].format(self._drv.sql.Identifier(view_name)), on_success=functools.partial(self._record_rollback, "view", view_name, None))
             elif action == 'sync' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back view {view_name} to its original state using: {original_state}")
+                self._queue_ddl(original_state, on_success=functools.partial(self._record_rollback, "view", view_name, original_state))
             else:
-                logging.warning(f"No rollback action found for view {view_name}.")
-        except PGError as e:
-            logging.error(f"Error rolling back view {view_name}: {e}")
+                logging.warning("No rollback action found for view %s.", view_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back view %s: %s", view_name, e)
 
-    def rollback_procedure(self, procedure_name):
+    def rollback_procedure(self, procedure_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='procedure' AND object_name=%s ORDER BY timestamp DESC LIMIT 1", (procedure_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("procedure", procedure_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP PROCEDURE IF EXISTS {procedure_name}")
-                logging.info(f"Dropped procedure {procedure_name} as part of rollback.")
+                self._queue_ddl(self._templates["drop_procedure"].format(self._drv.sql.Identifier(procedure_name)), on_success=functools.partial(self._record_rollback, "procedure", procedure_name, None))
             elif action == 'sync' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back procedure {procedure_name} to its original state using: {original_state}")
+                self._queue_ddl(original_state, on_success=functools.partial(self._record_rollback, "procedure", procedure_name, original_state))
             else:
-                logging.warning(f"No rollback action found for procedure {procedure_name}.")
-        except PGError as e:
-            logging.error(f"Error rolling back procedure {procedure_name}: {e}")
+                logging.warning("No rollback action found for procedure %s.", procedure_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back procedure %s: %s", procedure_name, e)
 
 class MongoDBSync(DatabaseSync):
     def connect(self):
+        import pymongo
+        from pymongo.write_concern import WriteConcern
+        self._drv = pymongo
         try:
             self.client = pymongo.MongoClient(**self.config)
             self.db = self.client.get_database()
-        except pymongo.errors.ConnectionError as e:
-            logging.error(f"Error connecting to MongoDB: {e}")
+            # The log is an audit trail, so writes are fire-and-forget
+            self.log_collection = self.db.get_collection("sync_log", write_concern=WriteConcern(w=0, j=False))
+        except pymongo.errors.ConnectionFailure as e:
+            logging.error("Error connecting to MongoDB: %s", e)
             raise
     
     def close(self):
+        self.flush_log()
         self.client.close()
     
     def log_sync_action(self, object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action):
+        self._buffer_log_row({
+            "object_type": object_type,
+            "object_name": object_name,
+            "action": action,
+            "source_code_hash": source_code_hash,
+            "sync_direction": sync_direction,
+            "original_state": original_state,
+            "new_state": new_state,
+            "rollback_action": rollback_action,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc)
+        })
+    
+    @contextmanager
+    def _log_connection(self):
+        # MongoClient is thread-safe, so the writer shares it
+        yield self.log_collection
+    
+    def _write_log_rows(self, conn, rows):
         try:
-            self.db.sync_log.insert_one({
-                "object_type": object_type,
-                "object_name": object_name,
-                "action": action,
-                "source_code_hash": source_code_hash,
-                "sync_direction": sync_direction,
-                "original_state": original_state,
-                "new_state": new_state,
-                "rollback_action": rollback_action,
-                "timestamp": pymongo.datetime.datetime.utcnow()
-            })
-        except pymongo.errors.PyMongoError as e:
-            logging.error(f"Error logging sync action: {e}")
+            conn.insert_many(rows, ordered=False)
+        except self._drv.errors.PyMongoError as e:
+            logging.error("Error logging sync actions: %s", e)
     
     def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target):
         # Implement MongoDB-specific logic for synchronizing tables (collections)
@@ -615,7 +1471,7 @@ class MongoDBSync(DatabaseSync):
     
     def synchronize_all_tables(self, alter_sync, source_code_hash, create_on_target):
         # Implement MongoDB-specific logic for synchronizing all tables (collections)
-        pass
+        return []
     
     def synchronize_all_views(self, alter_sync, source_code_hash, create_on_target):
         # Implement MongoDB-specific logic for synchronizing all views (if applicable)
@@ -629,48 +1485,77 @@ class MongoDBSync(DatabaseSync):
         # Implement MongoDB-specific logic for synchronizing indexes (if applicable)
         pass
     
-    def rollback_table(self, table_name):
+    def _last_log_entries(self, items):
+        # Rollback isn't implemented for this backend, so there is nothing to look up
+        return {}
+    
+    def rollback_table(self, table_name, entry=None):
         # Implement MongoDB-specific logic for rolling back tables (collections)
         pass
     
-    def rollback_view(self, view_name):
+    def rollback_view(self, view_name, entry=None):
         # Implement MongoDB-specific logic for rolling back views (if applicable)
         pass
     
-    def rollback_procedure(self, procedure_name):
+    def rollback_procedure(self, procedure_name, entry=None):
         # Implement MongoDB-specific logic for rolling back procedures (if applicable)
         pass
 
 class Neo4jSync(DatabaseSync):
     def connect(self):
+        from neo4j import GraphDatabase
         try:
             self.driver = GraphDatabase.driver(**self.config)
             self.session = self.driver.session()
         except Exception as e:
-            logging.error(f"Error connecting to Neo4j: {e}")
+            logging.error("Error connecting to Neo4j: %s", e)
             raise
     
     def close(self):
+        self.flush_log()
         self.session.close()
         self.driver.close()
     
     def log_sync_action(self, object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action):
+        self._buffer_log_row({
+            "object_type": object_type,
+            "object_name": object_name,
+            "action": action,
+            "source_code_hash": source_code_hash,
+            "sync_direction": sync_direction,
+            "original_state": original_state,
+            "new_state": new_state,
+            "rollback_action": rollback_action
+        })
+    
+    @contextmanager
+    def _log_connection(self):
+        # Sessions aren't thread-safe, so the writer opens its own
+        session = self.driver.session()
+        try:
+            yield session
+        finally:
+            session.close()
+    
+    def _write_log_rows(self, conn, rows):
         try:
-            self.session.run("""
+            # One transaction per flush instead of one per log entry
+            conn.run("""
+                UNWIND $rows AS row
                 CREATE (log:SyncLog {
-                    object_type: $object_type,
-                    object_name: $object_name,
-                    action: $action,
-                    source_code_hash: $source_code_hash,
-                    sync_direction: $sync_direction,
-                    original_state: $original_state,
-                    new_state: $new_state,
-                    rollback_action: $rollback_action,
+                    object_type: row.object_type,
+                    object_name: row.object_name,
+                    action: row.action,
+                    source_code_hash: row.source_code_hash,
+                    sync_direction: row.sync_direction,
+                    original_state: row.original_state,
+                    new_state: row.new_state,
+                    rollback_action: row.rollback_action,
                     timestamp: datetime()
                 })
-            """, object_type=object_type, object_name=object_name, action=action, source_code_hash=source_code_hash, sync_direction=sync_direction, original_state=original_state, new_state=new_state, rollback_action=rollback_action)
+            """, rows=rows)
         except Exception as e:
-            logging.error(f"Error logging sync action: {e}")
+            logging.error("Error logging sync actions: %s", e)
     
     def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target):
         # Implement Neo4j-specific logic for synchronizing nodes/relationships
@@ -686,7 +1571,7 @@ class Neo4jSync(DatabaseSync):
     
     def synchronize_all_tables(self, alter_sync, source_code_hash, create_on_target):
         # Implement Neo4j-specific logic for synchronizing all nodes/relationships
-        pass
+        return []
     
     def synchronize_all_views(self, alter_sync, source_code_hash, create_on_target):
         # Implement Neo4j-specific logic for synchronizing all views (if applicable)
@@ -700,542 +1585,994 @@ class Neo4jSync(DatabaseSync):
         # Implement Neo4j-specific logic for synchronizing indexes (if applicable)
         pass
     
-    def rollback_table(self, table_name):
+    def _last_log_entries(self, items):
+        # Rollback isn't implemented for this backend, so there is nothing to look up
+        return {}
+    
+    def rollback_table(self, table_name, entry=None):
         # Implement Neo4j-specific logic for rolling back nodes/relationships
         pass
     
-    def rollback_view(self, view_name):
+    def rollback_view(self, view_name, entry=None):
         # Implement Neo4j-specific logic for rolling back views (if applicable)
         pass
     
-    def rollback_procedure(self, procedure_name):
+    def rollback_procedure(self, procedure_name, entry=None):
         # Implement Neo4j-specific logic for rolling back procedures (if applicable)
         pass
 
 class SQLServerSync(DatabaseSync):
+    LOG_PARAM = "?"
+    SYNC_LOG_INDEX_DDL = """
+        IF OBJECT_ID('sync_log') IS NOT NULL
+            AND NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'idx_sync_log_lookup' AND object_id = OBJECT_ID('sync_log'))
+        CREATE INDEX idx_sync_log_lookup ON sync_log (object_type, object_name, timestamp DESC) INCLUDE (action)
+    """
+    HASHES_SQL = {
+        # OBJECT_DEFINITION is NULL for tables, so they are hashed by their column list
+        "table": """
+            SELECT t.TABLE_NAME, HASHBYTES('SHA2_256', (
+                SELECT STRING_AGG(CAST(CONCAT_WS(' ', c.COLUMN_NAME, c.DATA_TYPE, c.CHARACTER_MAXIMUM_LENGTH, c.NUMERIC_PRECISION, c.NUMERIC_SCALE, c.IS_NULLABLE) AS NVARCHAR(MAX)), ';') WITHIN GROUP (ORDER BY c.COLUMN_NAME)
+                FROM INFORMATION_SCHEMA.COLUMNS c
+                WHERE c.TABLE_SCHEMA = t.TABLE_SCHEMA AND c.TABLE_NAME = t.TABLE_NAME
+            ))
+            FROM INFORMATION_SCHEMA.TABLES t
+            WHERE t.TABLE_TYPE = 'BASE TABLE'
+        """,
+        "view": "SELECT v.TABLE_NAME, HASHBYTES('SHA2_256', OBJECT_DEFINITION(OBJECT_ID(QUOTENAME(v.TABLE_SCHEMA) + '.' + QUOTENAME(v.TABLE_NAME)))) FROM INFORMATION_SCHEMA.VIEWS v",
+        "procedure": "SELECT p.name, HASHBYTES('SHA2_256', OBJECT_DEFINITION(p.object_id)) FROM sys.procedures p",
+    }
+
     def connect(self):
+        import pyodbc
+        self._drv = pyodbc
         try:
-            conn_str = (
+            self._conn_str = (
                 f"DRIVER={{ODBC Driver 17 for SQL Server}};"
                 f"SERVER={self.config['host']};"
                 f"DATABASE={self.config['database']};"
                 f"UID={self.config['user']};"
                 f"PWD={self.config['password']}"
             )
-            self.conn = pyodbc.connect(conn_str)
-            self.cursor = self.conn.cursor()
-        except ODBCError as e:
-            logging.error(f"Error connecting to SQL Server: {e}")
+            self.conn = pyodbc.connect(self._conn_str)
+            self.cursor = self._new_cursor(self.conn)
+            self.cursor.execute(self.SYNC_LOG_INDEX_DDL)
+            self.conn.commit()
+            # Enterprise/Developer (3), Azure SQL Database (5) and Managed
+            # Instance (8) can build indexes and alter columns online
+            self._supports_online = self.cursor.execute("SELECT CAST(SERVERPROPERTY('EngineEdition') AS INT)").fetchval() in (3, 5, 8)
+            # pyodbc keeps the last statement prepared per cursor, so a cursor
+            # dedicated to rollback lookups prepares it only once
+            self._lookup_cursor = self._new_cursor(self.conn)
+        except self._drv.Error as e:
+            logging.error("Error connecting to SQL Server: %s", e)
             raise
     
     def close(self):
+        self.flush_log()
+        self._lookup_cursor.close()
         self.cursor.close()
         self.conn.close()
     
+    def _new_cursor(self, conn):
+        cursor = conn.cursor()
+        # Bulk-bind executemany parameters in one TDS payload instead of a
+        # round-trip per row, and fetch in batches by default
+        cursor.fast_executemany = True
+        cursor.arraysize = STREAM_BATCH_SIZE
+        return cursor
+    
+    def iter_hashes(self, object_type):
+        with self._borrow() as conn:
+            cursor = self._new_cursor(conn)
+            try:
+                cursor.execute(self.HASHES_SQL[object_type])
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row
+            finally:
+                cursor.close()
+    
+    @contextmanager
+    def _borrow(self):
+        # pyodbc pools connections in the ODBC driver manager, so closing
+        # hands the connection back rather than tearing it down
+        conn = self._drv.connect(self._conn_str)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def _sync_one(self, sync_method, name, alter_sync, source_code_hash, create_on_target, **kwargs):
+        with self._borrow() as conn:
+            cursor = self._new_cursor(conn)
+            try:
+                sync_method(name, alter_sync, source_code_hash, create_on_target, cursor=cursor, **kwargs)
+                conn.commit()
+            finally:
+                cursor.close()
+    
     def log_sync_action(self, object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action):
+        self._invalidate_cached_definition(object_type, object_name, action)
+        self._buffer_log_row((object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action, _ddl_hash(new_state)))
+    
+    @contextmanager
+    def _log_connection(self):
+        # The writer keeps one cursor for its lifetime; pyodbc re-prepares only
+        # when a cursor's SQL text changes, so every batch reuses the statement
+        with self._borrow() as conn:
+            cursor = self._new_cursor(conn)
+            try:
+                yield conn, cursor
+            finally:
+                cursor.close()
+    
+    def _write_log_rows(self, log, rows):
+        conn, cursor = log
         try:
-            self.cursor.execute("""
-                INSERT INTO sync_log (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action))
-            self.conn.commit()
-        except ODBCError as e:
-            logging.error(f"Error logging sync action: {e}")
+            # Bind the DDL columns as NVARCHAR(MAX) so fast_executemany doesn't
+            # size its parameter array from the first row
+            short, long = (self._drv.SQL_WVARCHAR, 255, 0), (self._drv.SQL_WLONGVARCHAR, 0, 0)
+            cursor.setinputsizes([short, short, short, short, short, long, long, short, (self._drv.SQL_BIGINT, 0, 0)])
+            cursor.executemany("""
+                INSERT INTO sync_log (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action, ddl_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+        except self._drv.Error as e:
+            logging.error("Error logging sync actions: %s", e)
+    
+    def get_table_definition(self, table, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+        return cursor.execute("SELECT OBJECT_DEFINITION(OBJECT_ID(?))", (table,)).fetchval()
+
+    def get_view_definition(self, view_name, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+        return cursor.execute("SELECT OBJECT_DEFINITION(OBJECT_ID(?))", (view_name,)).fetchval()
+
+    def get_procedure_definition(self, procedure_name, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+        return cursor.execute("SELECT OBJECT_DEFINITION(OBJECT_ID(?))", (procedure_name,)).fetchval()
+
+    def _table_columns(self, table, cursor):
+        cursor.execute("""
+            SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH, NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE, COLUMN_DEFAULT
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_NAME = ?
+        """, (table,))
+        return {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+
+    def _source_table_columns(self, table, cursor):
+        if self.source_sync is None:
+            return self._table_columns(table, cursor)
+        return self.source_sync._cached(("columns", table), functools.partial(self.source_sync._borrowed_table_columns, table))
     
-    def test_sql_statement(self, statement):
+    def _borrowed_table_columns(self, table):
+        with self._borrow() as conn:
+            cursor = self._new_cursor(conn)
+            try:
+                return self._table_columns(table, cursor)
+            finally:
+                cursor.close()
+
+    def _alter_table_statements(self, table, source_columns, target_columns):
+        quoted_table = _quote_sqlserver_identifier(table)
+        statements = []
+        for column, (data_type, max_length, precision, scale, nullable, default) in source_columns.items():
+            definition = f"{_quote_sqlserver_identifier(column)} {_sqlserver_column_type(data_type, max_length, precision, scale)} {'NULL' if nullable == 'YES' else 'NOT NULL'}"
+            if column not in target_columns:
+                # COLUMN_DEFAULT is the catalog's own expression text, e.g. ((0))
+                statements.append(f"ALTER TABLE {quoted_table} ADD {definition}" + (f" DEFAULT {default}" if default is not None else ""))
+            elif source_columns[column][:5] != target_columns[column][:5]:
+                # Defaults live in named constraints and are left alone here
+                statements.append(f"ALTER TABLE {quoted_table} ALTER COLUMN {definition}" + (" WITH (ONLINE = ON)" if self._supports_online else ""))
+        for column in target_columns.keys() - source_columns.keys():
+            statements.append(f"ALTER TABLE {quoted_table} DROP COLUMN {_quote_sqlserver_identifier(column)}")
+        return statements
+
+    def _replace_statements(self, object_kind, name, definition):
+        # CREATE OR ALTER keeps permissions and dependents and never leaves a
+        # window without the object; definitions that don't start with a
+        # plain CREATE (e.g. a leading comment) are still dropped first
+        statement, replaced = _SQLSERVER_CREATE_RE.subn(r"CREATE OR ALTER \1", definition, count=1)
+        if replaced:
+            return (statement,)
+        return (f"DROP {object_kind} IF EXISTS {_quote_sqlserver_identifier(name)}", definition)
+    
+    def _last_log_entry(self, object_type, object_name):
+        row = self._lookup_cursor.execute("SELECT TOP 1 original_state, action FROM sync_log WHERE object_type = ? AND object_name = ? ORDER BY timestamp DESC", (object_type, object_name)).fetchone()
+        return row if row else (None, None)
+    
+    def _execute_ddl(self, cursor, *statements):
+        # Run the statements and their validation in one round-trip: each one
+        # goes through sp_executesql (CREATE VIEW/PROCEDURE must start a batch)
+        # inside a transaction that the server rolls back if any of them fails.
+        batch = (
+            "SET XACT_ABORT ON;\n"
+            "BEGIN TRY\n"
+            "    BEGIN TRANSACTION;\n"
+            + "".join("    EXEC sp_executesql ?;\n" for _ in statements) +
+            "    COMMIT TRANSACTION;\n"
+            "END TRY\n"
+            "BEGIN CATCH\n"
+            "    IF @@TRANCOUNT > 0 ROLLBACK TRANSACTION;\n"
+            "    THROW;\n"
+            "END CATCH"
+        )
         try:
-            self.cursor.execute("BEGIN TRANSACTION")
-            self.cursor.execute(statement)
-            self.cursor.execute("ROLLBACK TRANSACTION")
+            cursor.execute(batch, statements)
             return True
-        except ODBCError as e:
-            logging.error(f"Invalid SQL statement: {statement}. Error: {e}")
-            self.cursor.execute("ROLLBACK TRANSACTION")
+        except self._drv.Error as e:
+            logging.error("Invalid SQL statement: %s. Error: %s", ';'.join(statements), e)
             return False
 
-    def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target):
+    def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target, cursor=None, source_hash=None, target_hash=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            # Retrieve original state from source
-            self.cursor.execute(f"SELECT OBJECT_DEFINITION (OBJECT_ID(N'{table}'))")
-            original_state = self.cursor.fetchone()
-            original_state = original_state[0] if original_state else None
+            if self._existing_tables is None:
+                # Retrieve original state from source
+                original_state = self._source_definition("table", table, cursor)
 
-            # Synchronization logic
-            self.cursor.execute(f"SELECT * FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_NAME = N'{table}'")
-            target_exists = bool(self.cursor.fetchone())
+                # Synchronization logic
+                target_exists = cursor.execute("SELECT 1 FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_NAME = ?", (table,)).fetchval() is not None
+            else:
+                # Only hashes were prefetched; the DDL is fetched once they differ
+                target_exists = table in self._existing_tables
+                if target_exists and source_hash == target_hash:
+                    logging.info("Table %s is already synchronized.", table)
+                    return
+                changed = True
+                original_state = self._source_definition("table", table, cursor)
+                target_state = self.get_table_definition(table, cursor) if target_exists else None
 
             if not target_exists:
-                if create_on_target:
-                    logging.info(f"Table {table} doesn't exist on target. Creating...")
-                    if self.test_sql_statement(original_state):
-                        self.cursor.execute(original_state)
+                if create_on_target and original_state is None:
+                    # OBJECT_DEFINITION has nothing for tables, so there is no DDL to replay
+                    logging.warning("No DDL available for table %s. It has to be created on the target manually.", table)
+                elif create_on_target:
+                    logging.info("Table %s doesn't exist on target. Creating...", table)
+                    if self._execute_ddl(cursor, original_state):
                         new_state = original_state
-                        logging.info(f"Table {table} created successfully on target.")
+                        logging.info("Table %s created successfully on target.", table)
                         self.log_sync_action("table", table, "create", source_code_hash, "source_to_target", None, new_state, "drop")
                 return
 
             # If the table exists on the target
-            self.cursor.execute(f"SELECT OBJECT_DEFINITION (OBJECT_ID(N'{table}'))")
-            target_state = self.cursor.fetchone()
-            target_state = target_state[0] if target_state else None
+            if self._existing_tables is None:
+                # Without a source both reads hit the target, so reuse the first
+                target_state = original_state if self.source_sync is None else self.get_table_definition(table, cursor)
+                changed = not _same_ddl(original_state, target_state)
 
-            if original_state != target_state:
-                logging.info(f"Synchronizing table: {table}")
+            if changed:
+                logging.info("Synchronizing table: %s", table)
                 if alter_sync:
-                    # Implement the logic for ALTER statements if required
-                    pass
+                    # Bring the columns in line in place instead of dropping
+                    # and recreating the table with its data
+                    statements = self._alter_table_statements(table, self._source_table_columns(table, cursor), self._table_columns(table, cursor))
+                    if not statements:
+                        logging.info("Table %s columns are already synchronized.", table)
+                        return
+                    try:
+                        for statement in statements:
+                            cursor.execute(statement)
+                        cursor.commit()
+                    except self._drv.Error:
+                        # Leave the table as it was rather than half altered
+                        cursor.rollback()
+                        raise
+                    new_state = ";\n".join(statements)
+                    logging.info("Table %s altered successfully.", table)
+                    self.log_sync_action("table", table, "alter", source_code_hash, "source_to_target", target_state, new_state, "alter")
+                elif original_state is None:
+                    logging.warning("No DDL available for table %s. Use --alter-sync to synchronize its columns.", table)
                 else:
-                    self.cursor.execute(f"DROP TABLE IF EXISTS {table}")
-                    if self.test_sql_statement(original_state):
-                        self.cursor.execute(original_state)
+                    if self._execute_ddl(cursor, f"DROP TABLE IF EXISTS {_quote_sqlserver_identifier(table)}", original_state):
                         new_state = original_state
-                        logging.info(f"Table {table} synchronized successfully.")
+                        logging.info("Table %s synchronized successfully.", table)
                         self.log_sync_action("table", table, "sync", source_code_hash, "source_to_target", target_state, new_state, "drop")
             else:
-                logging.info(f"Table {table} is already synchronized.")
-        except ODBCError as e:
-            logging.error(f"Error synchronizing table {table}: {e}")
+                logging.info("Table %s is already synchronized.", table)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing table %s: %s", table, e)
 
-    def synchronize_view(self, view_name, alter_sync, source_code_hash, create_on_target):
+    def synchronize_view(self, view_name, alter_sync, source_code_hash, create_on_target, cursor=None, source_hash=None, target_hash=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            source_definition = self.get_view_definition(view_name)
-            self.cursor.execute(f"SELECT OBJECT_DEFINITION (OBJECT_ID(N'{view_name}'))")
-            original_state = self.cursor.fetchone()
-            original_state = original_state[0] if original_state else None
+            if self._existing_views is None:
+                source_definition = self._source_definition("view", view_name, cursor)
+                original_state = source_definition if self.source_sync is None else self.get_view_definition(view_name, cursor)
 
-            self.cursor.execute(f"SELECT * FROM INFORMATION_SCHEMA.VIEWS WHERE TABLE_NAME = N'{view_name}'")
-            target_exists = bool(self.cursor.fetchone())
+                target_exists = cursor.execute("SELECT 1 FROM INFORMATION_SCHEMA.VIEWS WHERE TABLE_NAME = ?", (view_name,)).fetchval() is not None
+            else:
+                # Only hashes were prefetched; the DDL is fetched once they differ
+                target_exists = view_name in self._existing_views
+                if target_exists and source_hash == target_hash:
+                    logging.info("View %s is already synchronized.", view_name)
+                    return
+                source_definition = self._source_definition("view", view_name, cursor)
+                original_state = self.get_view_definition(view_name, cursor) if target_exists else None
+
+            if source_definition is None:
+                logging.warning("View %s not found on source. Skipping.", view_name)
+                return
+            if not target_exists:
+                if create_on_target:
+                    logging.info("View %s doesn't exist on target. Creating...", view_name)
 
-            if not target_exists and create_on_target:
-                logging.info(f"View {view_name} doesn't exist on target. Creating...")
-                
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
-                    new_state = source_definition
-                    logging.info(f"View {view_name} created successfully on target.")
-                    self.log_sync_action("view", view_name, "create", source_code_hash, "source_to_target", original_state, new_state, "drop")
+                    if self._execute_ddl(cursor, source_definition):
+                        new_state = source_definition
+                        logging.info("View %s created successfully on target.", view_name)
+                        self.log_sync_action("view", view_name, "create", source_code_hash, "source_to_target", original_state, new_state, "drop")
                 return
 
-            if source_definition != original_state:
-                logging.info(f"Synchronizing view: {view_name}")
-                self.cursor.execute(f"DROP VIEW IF EXISTS {view_name}")
-                
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
+            if not _same_ddl(source_definition, original_state):
+                logging.info("Synchronizing view: %s", view_name)
+                if self._execute_ddl(cursor, *self._replace_statements("VIEW", view_name, source_definition)):
                     new_state = source_definition
-                    logging.info(f"View {view_name} synchronized successfully.")
+                    logging.info("View %s synchronized successfully.", view_name)
                     self.log_sync_action("view", view_name, "sync", source_code_hash, "source_to_target", original_state, new_state, "drop")
             else:
-                logging.info(f"View {view_name} is already synchronized.")
-        except ODBCError as e:
-            logging.error(f"Error synchronizing view {view_name}: {e}")
+                logging.info("View %s is already synchronized.", view_name)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing view %s: %s", view_name, e)
 
-    def synchronize_procedure(self, procedure_name, alter_sync, source_code_hash, create_on_target):
+    def synchronize_procedure(self, procedure_name, alter_sync, source_code_hash, create_on_target, cursor=None, source_hash=None, target_hash=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            source_definition = self.get_procedure_definition(procedure_name)
-
-            self.cursor.execute(f"SELECT * FROM sys.procedures WHERE name = '{procedure_name}'")
-            target_exists = bool(self.cursor.fetchone())
+            if self._existing_procedures is None:
+                source_definition = self._source_definition("procedure", procedure_name, cursor)
 
+                target_exists = cursor.execute("SELECT 1 FROM sys.procedures WHERE name = ?", (procedure_name,)).fetchval() is not None
+            else:
+                # Only hashes were prefetched; the DDL is fetched once they differ
+                target_exists = procedure_name in self._existing_procedures
+                if target_exists and source_hash == target_hash:
+                    logging.info("Procedure %s is already synchronized.", procedure_name)
+                    return
+                source_definition = self._source_definition("procedure", procedure_name, cursor)
+
+            if source_definition is None:
+                logging.warning("Procedure %s not found on source. Skipping.", procedure_name)
+                return
             if not target_exists or create_on_target:
                 if not target_exists:
-                    logging.info(f"Procedure {procedure_name} doesn't exist on target. Creating...")
+                    logging.info("Procedure %s doesn't exist on target. Creating...", procedure_name)
                 else:
-                    logging.info(f"Procedure {procedure_name} creation is not disabled. Creating...")
+                    logging.info("Procedure %s creation is not disabled. Creating...", procedure_name)
 
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
+                if self._execute_ddl(cursor, source_definition):
                     new_state = source_definition
-                    logging.info(f"Procedure {procedure_name} created successfully on target.")
+                    logging.info("Procedure %s created successfully on target.", procedure_name)
                     self.log_sync_action("procedure", procedure_name, "create", source_code_hash, "source_to_target", None, new_state, "drop")
                 return
 
             if target_exists:
-                target_definition = self.get_procedure_definition(procedure_name)
+                target_definition = source_definition if self.source_sync is None else self.get_procedure_definition(procedure_name, cursor)
                 original_state = target_definition
 
-                if source_definition != target_definition:
-                    logging.info(f"Synchronizing procedure: {procedure_name}")
-                    self.cursor.execute(f"DROP PROCEDURE IF EXISTS {procedure_name}")
-                    
-                    if self.test_sql_statement(source_definition):
-                        self.cursor.execute(source_definition)
+                if not _same_ddl(source_definition, target_definition):
+                    logging.info("Synchronizing procedure: %s", procedure_name)
+                    if self._execute_ddl(cursor, *self._replace_statements("PROCEDURE", procedure_name, source_definition)):
                         new_state = source_definition
-                        logging.info(f"Procedure {procedure_name} synchronized successfully.")
+                        logging.info("Procedure %s synchronized successfully.", procedure_name)
                         self.log_sync_action("procedure", procedure_name, "sync", source_code_hash, "source_to_target", original_state, new_state, "drop")
                 else:
-                    logging.info(f"Procedure {procedure_name} is already synchronized.")
-        except ODBCError as e:
-            logging.error(f"Error synchronizing procedure {procedure_name}: {e}")
+                    logging.info("Procedure %s is already synchronized.", procedure_name)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing procedure %s: %s", procedure_name, e)
 
     def synchronize_all_tables(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE = 'BASE TABLE'")
-            tables_to_sync = [table[0] for table in self.cursor.fetchall()]
+            # One round-trip per side for every object's name and DDL hash;
+            # full definitions are only fetched for objects whose hashes differ
+            target_hashes = self._load_all_hashes("table")
+            self._existing_tables = set(target_hashes)
+            source_hashes = {}
 
-            for table in tables_to_sync:
-                self.synchronize_table(table, alter_sync, source_code_hash, create_on_target)
-        except ODBCError as e:
-            logging.error(f"Error synchronizing all tables: {e}")
+            return self._sync_all(self.synchronize_table, self._source_hashes("table", target_hashes, source_hashes), alter_sync, source_code_hash, create_on_target, source_states=source_hashes, target_states=target_hashes, state_args=("source_hash", "target_hash"))
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all tables: %s", e)
+            return []
 
     def synchronize_all_views(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT TABLE_NAME FROM INFORMATION_SCHEMA.VIEWS")
-            views_to_sync = [view[0] for view in self.cursor.fetchall()]
+            # One round-trip per side for every object's name and DDL hash;
+            # full definitions are only fetched for objects whose hashes differ
+            target_hashes = self._load_all_hashes("view")
+            self._existing_views = set(target_hashes)
+            source_hashes = {}
 
-            for view in views_to_sync:
-                self.synchronize_view(view, alter_sync, source_code_hash, create_on_target)
-        except ODBCError as e:
-            logging.error(f"Error synchronizing all views: {e}")
+            self._sync_all(self.synchronize_view, self._source_hashes("view", target_hashes, source_hashes), alter_sync, source_code_hash, create_on_target, source_states=source_hashes, target_states=target_hashes, state_args=("source_hash", "target_hash"))
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all views: %s", e)
 
     def synchronize_all_procedures(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT name FROM sys.procedures")
-            procedures_to_sync = [proc[0] for proc in self.cursor.fetchall()]
+            # One round-trip per side for every object's name and DDL hash;
+            # full definitions are only fetched for objects whose hashes differ
+            target_hashes = self._load_all_hashes("procedure")
+            self._existing_procedures = set(target_hashes)
+            source_hashes = {}
 
-            for procedure in procedures_to_sync:
-                self.synchronize_procedure(procedure, alter_sync, source_code_hash, create_on_target)
-        except ODBCError as e:
-            logging.error(f"Error synchronizing all procedures: {e}")
+            self._sync_all(self.synchronize_procedure, self._source_hashes("procedure", target_hashes, source_hashes), alter_sync, source_code_hash, create_on_target, source_states=source_hashes, target_states=target_hashes, state_args=("source_hash", "target_hash"))
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all procedures: %s", e)
 
     def synchronize_indexes(self, table):
         try:
-            self.cursor.execute(f"""
-                SELECT i.name, COL_NAME(ic.object_id, ic.column_id) AS column_name
+            # One row per index with its key columns in order, so composite
+            # indexes are created once rather than once per column
+            self.cursor.execute("""
+                SELECT i.name, STRING_AGG(QUOTENAME(COL_NAME(ic.object_id, ic.column_id)), ', ') WITHIN GROUP (ORDER BY ic.key_ordinal) AS column_names
                 FROM sys.indexes AS i
                 INNER JOIN sys.index_columns AS ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-                WHERE i.is_primary_key = 0 AND OBJECT_NAME(ic.object_id) = '{table}'
-            """)
-            indexes = self.cursor.fetchall()
-            for index in indexes:
-                create_index_statement = f"CREATE INDEX {index[0]} ON {table} ({index[1]})"
-                logging.info(f"Creating index: {create_index_statement}")
-                if self.test_sql_statement(create_index_statement):
-                    self.cursor.execute(create_index_statement)
-        except ODBCError as e:
-            logging.error(f"Error synchronizing indexes for table {table}: {e}")
-
-    def rollback_table(self, table_name):
-        try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='table' AND object_name=? ORDER BY timestamp DESC LIMIT 1", (table_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+                WHERE i.is_primary_key = 0 AND ic.is_included_column = 0 AND OBJECT_NAME(ic.object_id) = ?
+                GROUP BY i.object_id, i.name
+            """, (table,))
+            online = " WITH (ONLINE = ON)" if self._supports_online else ""
+            statements = [f"CREATE INDEX {_quote_sqlserver_identifier(index_name)} ON {_quote_sqlserver_identifier(table)} ({column_names}){online}" for index_name, column_names in self.cursor.fetchall()]
+            if not statements:
+                return
+            for statement in statements:
+                logging.info("Creating index: %s", statement)
+            # pyodbc leaves an implicit transaction open around the batch's own
+            if self._execute_ddl(self.cursor, *statements):
+                self.conn.commit()
+        except self._drv.Error as e:
+            logging.error("Error synchronizing indexes for table %s: %s", table, e)
+
+    def rollback_table(self, table_name, entry=None):
+        try:
+            original_state, action = entry if entry is not None else self._last_log_entry("table", table_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-                logging.info(f"Dropped table {table_name} as part of rollback.")
+                self._queue_ddl(f"DROP TABLE IF EXISTS {_quote_sqlserver_identifier(table_name)}", on_success=functools.partial(self._record_rollback, "table", table_name, None))
             elif action == 'alter' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back table {table_name} to its original state using: {original_state}")
+                self._queue_ddl(original_state, on_success=functools.partial(self._record_rollback, "table", table_name, original_state))
             else:
-                logging.warning(f"No rollback action found for table {table_name}.")
-        except ODBCError as e:
-            logging.error(f"Error rolling back table {table_name}: {e}")
+                logging.warning("No rollback action found for table %s.", table_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back table %s: %s", table_name, e)
 
-    def rollback_view(self, view_name):
+    def rollback_view(self, view_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='view' AND object_name=? ORDER BY timestamp DESC LIMIT 1", (view_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("view", view_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP VIEW IF EXISTS {view_name}")
-                logging.info(f"Dropped view {view_name} as part of rollback.")
+                self._queue_ddl(f"DROP VIEW IF EXISTS {_quote_sqlserver_identifier(view_name)}", on_success=functools.partial(self._record_rollback, "view", view_name, None))
             elif action == 'sync' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back view {view_name} to its original state using: {original_state}")
+                self._queue_ddl(*self._replace_statements("VIEW", view_name, original_state), on_success=functools.partial(self._record_rollback, "view", view_name, original_state))
             else:
-                logging.warning(f"No rollback action found for view {view_name}.")
-        except ODBCError as e:
-            logging.error(f"Error rolling back view {view_name}: {e}")
+                logging.warning("No rollback action found for view %s.", view_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back view %s: %s", view_name, e)
 
-    def rollback_procedure(self, procedure_name):
+    def rollback_procedure(self, procedure_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='procedure' AND object_name=? ORDER BY timestamp DESC LIMIT 1", (procedure_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("procedure", procedure_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP PROCEDURE IF EXISTS {procedure_name}")
-                logging.info(f"Dropped procedure {procedure_name} as part of rollback.")
+                self._queue_ddl(f"DROP PROCEDURE IF EXISTS {_quote_sqlserver_identifier(procedure_name)}", on_success=functools.partial(self._record_rollback, "procedure", procedure_name, None))
             elif action == 'sync' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back procedure {procedure_name} to its original state using: {original_state}")
+                self._queue_ddl(*self._replace_statements("PROCEDURE", procedure_name, original_state), on_success=functools.partial(self._record_rollback, "procedure", procedure_name, original_state))
             else:
-                logging.warning(f"No rollback action found for procedure {procedure_name}.")
-        except ODBCError as e:
-            logging.error(f"Error rolling back procedure {procedure_name}: {e}")
+                logging.warning("No rollback action found for procedure %s.", procedure_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back procedure %s: %s", procedure_name, e)
 
 class OracleSync(DatabaseSync):
+    LOG_PARAM = ":1"
+    # ORA-00955/01408: index already exists; ORA-00942: no sync_log table yet
+    SYNC_LOG_INDEX_DDL = """
+        BEGIN
+            EXECUTE IMMEDIATE 'CREATE INDEX idx_sync_log_lookup ON sync_log (object_type, object_name, timestamp DESC)';
+        EXCEPTION
+            WHEN OTHERS THEN
+                IF SQLCODE NOT IN (-955, -1408, -942) THEN
+                    RAISE;
+                END IF;
+        END;
+    """
+    # DBMS_CRYPTO.HASH type 4 is SHA-256
+    HASHES_SQL = {
+        "table": "SELECT table_name, DBMS_CRYPTO.HASH(dbms_metadata.get_ddl('TABLE', table_name), 4) FROM user_tables",
+        "view": "SELECT view_name, DBMS_CRYPTO.HASH(dbms_metadata.get_ddl('VIEW', view_name), 4) FROM user_views",
+        "procedure": "SELECT object_name, DBMS_CRYPTO.HASH(dbms_metadata.get_ddl('PROCEDURE', object_name), 4) FROM user_procedures WHERE object_type = 'PROCEDURE'",
+    }
+
     def connect(self):
+        import cx_Oracle
+        self._drv = cx_Oracle
         try:
             dsn_tns = cx_Oracle.makedsn(self.config['host'], self.config['port'], sid=self.config['sid'])
-            self.conn = cx_Oracle.connect(user=self.config['user'], password=self.config['password'], dsn=dsn_tns)
+            # The main connection, one streaming catalog rows, the sync_log
+            # writer and one per worker
+            pool_size = self.max_workers + 3
+            self.pool = _shared_pool(self._pool_key(pool_size), lambda: self._create_pool(dsn_tns, pool_size))
+            self.conn = self._acquire()
             self.cursor = self.conn.cursor()
-        except OracleError as e:
-            logging.error(f"Error connecting to Oracle: {e}")
+            self.cursor.arraysize = STREAM_BATCH_SIZE
+            self.cursor.prefetchrows = STREAM_BATCH_SIZE
+            self.cursor.execute(self.SYNC_LOG_INDEX_DDL)
+            self._supports_online = self._online_index_build()
+            # Parsed once; rollback lookups only rebind the object
+            self._lookup_cursor = self.conn.cursor()
+            self._lookup_cursor.prepare("SELECT original_state, action FROM sync_log WHERE object_type = :1 AND object_name = :2 ORDER BY timestamp DESC FETCH FIRST 1 ROWS ONLY")
+        except self._drv.Error as e:
+            logging.error("Error connecting to Oracle: %s", e)
             raise
     
     def close(self):
+        self.flush_log()
+        self._lookup_cursor.close()
         self.cursor.close()
-        self.conn.close()
+        self.pool.release(self.conn)
+    
+    def _create_pool(self, dsn, size):
+        # Wait for a free session rather than fail when every one is borrowed:
+        # a shared source pool serves more borrowers than it has sessions
+        pool = self._drv.SessionPool(user=self.config['user'], password=self.config['password'], dsn=dsn, min=1, max=size, increment=1, threaded=True, getmode=self._drv.SPOOL_ATTRVAL_WAIT)
+        # Catalog lookups repeat the same few statements per object, so let
+        # every pooled session keep their parsed cursors
+        pool.stmtcachesize = 100
+        return pool
+    
+    def _lob_as_str(self, cursor, name, default_type, size, precision, scale):
+        # Return DDL CLOBs as str rather than LOB locators that need a read
+        if default_type == self._drv.DB_TYPE_CLOB:
+            return cursor.var(self._drv.DB_TYPE_LONG, arraysize=cursor.arraysize)
+    
+    def _acquire(self):
+        conn = self.pool.acquire()
+        conn.outputtypehandler = self._lob_as_str
+        return conn
+    
+    def _online_index_build(self):
+        # Enterprise Edition only; V$OPTION may not be readable, in which case
+        # indexes are built offline as before
+        try:
+            self.cursor.execute("SELECT value FROM v$option WHERE parameter = 'Online Index Build'")
+            row = self.cursor.fetchone()
+            return bool(row) and row[0] == "TRUE"
+        except self._drv.Error:
+            return False
+    
+    def iter_hashes(self, object_type):
+        with self._borrow() as conn:
+            cursor = conn.cursor()
+            # Catalog rows are streamed in large batches
+            cursor.arraysize = STREAM_BATCH_SIZE
+            cursor.prefetchrows = STREAM_BATCH_SIZE
+            try:
+                cursor.execute(self.HASHES_SQL[object_type])
+                for row in cursor:
+                    yield row
+            finally:
+                cursor.close()
+    
+    @contextmanager
+    def _borrow(self):
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self.pool.release(conn)
+    
+    def _sync_one(self, sync_method, name, alter_sync, source_code_hash, create_on_target, **kwargs):
+        with self._borrow() as conn:
+            cursor = conn.cursor()
+            try:
+                sync_method(name, alter_sync, source_code_hash, create_on_target, cursor=cursor, **kwargs)
+            finally:
+                cursor.close()
     
     def log_sync_action(self, object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action):
+        self._invalidate_cached_definition(object_type, object_name, action)
+        self._buffer_log_row((object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action, _ddl_hash(new_state)))
+    
+    @contextmanager
+    def _log_connection(self):
+        # Parsed once for the writer's lifetime; each batch only binds and executes
+        with self._borrow() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.prepare("""
+                    INSERT INTO sync_log (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action, ddl_hash)
+                    VALUES (:1, :2, :3, :4, :5, :6, :7, :8, :9)
+                """)
+                yield conn, cursor
+            finally:
+                cursor.close()
+    
+    def _write_log_rows(self, log, rows):
+        conn, cursor = log
         try:
-            self.cursor.execute("""
-                INSERT INTO sync_log (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action)
-                VALUES (:1, :2, :3, :4, :5, :6, :7, :8)
-            """, (object_type, object_name, action, source_code_hash, sync_direction, original_state, new_state, rollback_action))
-            self.conn.commit()
-        except OracleError as e:
-            logging.error(f"Error logging sync action: {e}")
+            # Array-bind the DDL columns as CLOBs; plain strings are capped at 32k
+            cursor.setinputsizes(None, None, None, None, None, self._drv.CLOB, self._drv.CLOB, None, None)
+            cursor.executemany(None, rows)
+            conn.commit()
+        except self._drv.Error as e:
+            logging.error("Error logging sync actions: %s", e)
+    
+    def get_table_definition(self, table, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+        cursor.execute("SELECT dbms_metadata.get_ddl('TABLE', :1) FROM dual", (table.upper(),))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def get_view_definition(self, view_name, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+        cursor.execute("SELECT dbms_metadata.get_ddl('VIEW', :1) FROM dual", (view_name.upper(),))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def get_procedure_definition(self, procedure_name, cursor=None):
+        if cursor is None:
+            cursor = self.cursor
+        cursor.execute("SELECT dbms_metadata.get_ddl('PROCEDURE', :1) FROM dual", (procedure_name.upper(),))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _placeholders(self, count):
+        return [f":{i}" for i in range(1, count + 1)]
+    
+    def _last_log_entry(self, object_type, object_name):
+        self._lookup_cursor.execute(None, (object_type, object_name))
+        row = self._lookup_cursor.fetchone()
+        return row if row else (None, None)
     
-    def test_sql_statement(self, statement):
+    def _execute_ddl(self, cursor, *statements):
+        # DDL commits implicitly on Oracle, so there is no savepoint to return
+        # to; several statements go as one PL/SQL block to save round-trips
         try:
-            self.cursor.execute("BEGIN")
-            self.cursor.execute(statement)
-            self.cursor.execute("ROLLBACK")
+            cursor.execute(statements[0] if len(statements) == 1 else _plsql_block(statements))
             return True
-        except OracleError as e:
-            logging.error(f"Invalid SQL statement: {statement}. Error: {e}")
-            self.cursor.execute("ROLLBACK")
+        except self._drv.Error as e:
+            logging.error("Invalid SQL statement: %s. Error: %s", ';'.join(statements), e)
             return False
-
-    def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target):
+    
+    @contextmanager
+    def transaction(self):
+        # Each DDL statement commits on its own, so a batch that fails part way
+        # leaves the earlier rollbacks applied with no sync_log row. Run each
+        # rollback as it is queued so it is logged as soon as it succeeds.
+        yield
+    
+    def synchronize_table(self, table, alter_sync, source_code_hash, create_on_target, cursor=None, source_hash=None, target_hash=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            # Retrieve original state from source
-            self.cursor.execute(f"SELECT dbms_metadata.get_ddl('TABLE', '{table.upper()}') FROM dual")
-            original_state = self.cursor.fetchone()
-            original_state = original_state[0] if original_state else None
+            if self._existing_tables is None:
+                # Retrieve original state from source
+                original_state = self._source_definition("table", table, cursor)
 
-            # Synchronization logic
-            self.cursor.execute(f"SELECT table_name FROM user_tables WHERE table_name = '{table.upper()}'")
-            target_exists = bool(self.cursor.fetchone())
+                # Synchronization logic
+                cursor.execute("SELECT table_name FROM user_tables WHERE table_name = :1", (table.upper(),))
+                target_exists = bool(cursor.fetchone())
+            else:
+                # Only hashes were prefetched; the DDL is fetched once they differ
+                target_exists = table in self._existing_tables
+                if target_exists and source_hash == target_hash:
+                    logging.info("Table %s is already synchronized.", table)
+                    return
+                original_state = self._source_definition("table", table, cursor)
+                target_state = self.get_table_definition(table, cursor) if target_exists else None
 
             if not target_exists:
                 if create_on_target:
-                    logging.info(f"Table {table} doesn't exist on target. Creating...")
-                    if self.test_sql_statement(original_state):
-                        self.cursor.execute(original_state)
+                    logging.info("Table %s doesn't exist on target. Creating...", table)
+                    if self._execute_ddl(cursor, original_state):
                         new_state = original_state
-                        logging.info(f"Table {table} created successfully on target.")
+                        logging.info("Table %s created successfully on target.", table)
                         self.log_sync_action("table", table, "create", source_code_hash, "source_to_target", None, new_state, "drop")
                 return
 
             # If the table exists on the target
-            self.cursor.execute(f"SELECT dbms_metadata.get_ddl('TABLE', '{table.upper()}') FROM dual")
-            target_state = self.cursor.fetchone()
-            target_state = target_state[0] if target_state else None
+            if self._existing_tables is None:
+                # Without a source both reads hit the target, so reuse the first
+                target_state = original_state if self.source_sync is None else self.get_table_definition(table, cursor)
 
-            if original_state != target_state:
-                logging.info(f"Synchronizing table: {table}")
+            if not _same_ddl(original_state, target_state):
+                logging.info("Synchronizing table: %s", table)
                 if alter_sync:
                     # Implement the logic for ALTER statements if required
                     pass
                 else:
-                    self.cursor.execute(f"DROP TABLE {table}")
-                    if self.test_sql_statement(original_state):
-                        self.cursor.execute(original_state)
+                    if self._execute_ddl(cursor, f"DROP TABLE {_quote_oracle_identifier(table)}", original_state):
                         new_state = original_state
-                        logging.info(f"Table {table} synchronized successfully.")
+                        logging.info("Table %s synchronized successfully.", table)
                         self.log_sync_action("table", table, "sync", source_code_hash, "source_to_target", target_state, new_state, "drop")
             else:
-                logging.info(f"Table {table} is already synchronized.")
-        except OracleError as e:
-            logging.error(f"Error synchronizing table {table}: {e}")
+                logging.info("Table %s is already synchronized.", table)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing table %s: %s", table, e)
 
-    def synchronize_view(self, view_name, alter_sync, source_code_hash, create_on_target):
+    def synchronize_view(self, view_name, alter_sync, source_code_hash, create_on_target, cursor=None, source_hash=None, target_hash=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            source_definition = self.get_view_definition(view_name)
-            self.cursor.execute(f"SELECT dbms_metadata.get_ddl('VIEW', '{view_name.upper()}') FROM dual")
-            original_state = self.cursor.fetchone()
-            original_state = original_state[0] if original_state else None
+            if self._existing_views is None:
+                source_definition = self._source_definition("view", view_name, cursor)
+                original_state = source_definition if self.source_sync is None else self.get_view_definition(view_name, cursor)
 
-            self.cursor.execute(f"SELECT view_name FROM user_views WHERE view_name = '{view_name.upper()}'")
-            target_exists = bool(self.cursor.fetchone())
+                cursor.execute("SELECT view_name FROM user_views WHERE view_name = :1", (view_name.upper(),))
+                target_exists = bool(cursor.fetchone())
+            else:
+                # Only hashes were prefetched; the DDL is fetched once they differ
+                target_exists = view_name in self._existing_views
+                if target_exists and source_hash == target_hash:
+                    logging.info("View %s is already synchronized.", view_name)
+                    return
+                source_definition = self._source_definition("view", view_name, cursor)
+                original_state = self.get_view_definition(view_name, cursor) if target_exists else None
 
-            if not target_exists and create_on_target:
-                logging.info(f"View {view_name} doesn't exist on target. Creating...")
-                
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
-                    new_state = source_definition
-                    logging.info(f"View {view_name} created successfully on target.")
-                    self.log_sync_action("view", view_name, "create", source_code_hash, "source_to_target", original_state, new_state, "drop")
+            if not target_exists:
+                if create_on_target:
+                    logging.info("View %s doesn't exist on target. Creating...", view_name)
+
+                    if self._execute_ddl(cursor, source_definition):
+                        new_state = source_definition
+                        logging.info("View %s created successfully on target.", view_name)
+                        self.log_sync_action("view", view_name, "create", source_code_hash, "source_to_target", original_state, new_state, "drop")
                 return
 
-            if source_definition != original_state:
-                logging.info(f"Synchronizing view: {view_name}")
-                self.cursor.execute(f"DROP VIEW {view_name}")
+            if not _same_ddl(source_definition, original_state):
+                logging.info("Synchronizing view: %s", view_name)
+                # get_ddl emits CREATE OR REPLACE, which keeps grants and
+                # doesn't invalidate dependents the way a DROP does
+                if not _ORACLE_CREATE_OR_REPLACE_RE.match(source_definition):
+                    cursor.execute(f"DROP VIEW {_quote_oracle_identifier(view_name)}")
                 
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
+                if self._execute_ddl(cursor, source_definition):
                     new_state = source_definition
-                    logging.info(f"View {view_name} synchronized successfully.")
+                    logging.info("View %s synchronized successfully.", view_name)
                     self.log_sync_action("view", view_name, "sync", source_code_hash, "source_to_target", original_state, new_state, "drop")
             else:
-                logging.info(f"View {view_name} is already synchronized.")
-        except OracleError as e:
-            logging.error(f"Error synchronizing view {view_name}: {e}")
+                logging.info("View %s is already synchronized.", view_name)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing view %s: %s", view_name, e)
 
-    def synchronize_procedure(self, procedure_name, alter_sync, source_code_hash, create_on_target):
+    def synchronize_procedure(self, procedure_name, alter_sync, source_code_hash, create_on_target, cursor=None, source_hash=None, target_hash=None):
+        if cursor is None:
+            cursor = self.cursor
         try:
-            source_definition = self.get_procedure_definition(procedure_name)
+            if self._existing_procedures is None:
+                source_definition = self._source_definition("procedure", procedure_name, cursor)
 
-            self.cursor.execute(f"SELECT object_name FROM user_procedures WHERE object_name = '{procedure_name.upper()}'")
-            target_exists = bool(self.cursor.fetchone())
+                cursor.execute("SELECT object_name FROM user_procedures WHERE object_name = :1", (procedure_name.upper(),))
+                target_exists = bool(cursor.fetchone())
+            else:
+                # Only hashes were prefetched; the DDL is fetched once they differ
+                target_exists = procedure_name in self._existing_procedures
+                if target_exists and source_hash == target_hash:
+                    logging.info("Procedure %s is already synchronized.", procedure_name)
+                    return
+                source_definition = self._source_definition("procedure", procedure_name, cursor)
 
             if not target_exists or create_on_target:
                 if not target_exists:
-                    logging.info(f"Procedure {procedure_name} doesn't exist on target. Creating...")
+                    logging.info("Procedure %s doesn't exist on target. Creating...", procedure_name)
                 else:
-                    logging.info(f"Procedure {procedure_name} creation is not disabled. Creating...")
+                    logging.info("Procedure %s creation is not disabled. Creating...", procedure_name)
 
-                if self.test_sql_statement(source_definition):
-                    self.cursor.execute(source_definition)
+                if self._execute_ddl(cursor, source_definition):
                     new_state = source_definition
-                    logging.info(f"Procedure {procedure_name} created successfully on target.")
+                    logging.info("Procedure %s created successfully on target.", procedure_name)
                     self.log_sync_action("procedure", procedure_name, "create", source_code_hash, "source_to_target", None, new_state, "drop")
                 return
 
             if target_exists:
-                target_definition = self.get_procedure_definition(procedure_name)
+                target_definition = source_definition if self.source_sync is None else self.get_procedure_definition(procedure_name, cursor)
                 original_state = target_definition
 
-                if source_definition != target_definition:
-                    logging.info(f"Synchronizing procedure: {procedure_name}")
-                    self.cursor.execute(f"DROP PROCEDURE {procedure_name}")
+                if not _same_ddl(source_definition, target_definition):
+                    logging.info("Synchronizing procedure: %s", procedure_name)
+                    if not _ORACLE_CREATE_OR_REPLACE_RE.match(source_definition):
+                        cursor.execute(f"DROP PROCEDURE {_quote_oracle_identifier(procedure_name)}")
                     
-                    if self.test_sql_statement(source_definition):
-                        self.cursor.execute(source_definition)
+                    if self._execute_ddl(cursor, source_definition):
                         new_state = source_definition
-                        logging.info(f"Procedure {procedure_name} synchronized successfully.")
+                        logging.info("Procedure %s synchronized successfully.", procedure_name)
                         self.log_sync_action("procedure", procedure_name, "sync", source_code_hash, "source_to_target", original_state, new_state, "drop")
                 else:
-                    logging.info(f"Procedure {procedure_name} is already synchronized.")
-        except OracleError as e:
-            logging.error(f"Error synchronizing procedure {procedure_name}: {e}")
+                    logging.info("Procedure %s is already synchronized.", procedure_name)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing procedure %s: %s", procedure_name, e)
 
     def synchronize_all_tables(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT table_name FROM user_tables")
-            tables_to_sync = [table[0] for table in self.cursor.fetchall()]
+            # One round-trip per side for every object's name and DDL hash;
+            # full definitions are only fetched for objects whose hashes differ
+            target_hashes = self._load_all_hashes("table")
+            self._existing_tables = set(target_hashes)
+            source_hashes = {}
 
-            for table in tables_to_sync:
-                self.synchronize_table(table, alter_sync, source_code_hash, create_on_target)
-        except OracleError as e:
-            logging.error(f"Error synchronizing all tables: {e}")
+            return self._sync_all(self.synchronize_table, self._source_hashes("table", target_hashes, source_hashes), alter_sync, source_code_hash, create_on_target, source_states=source_hashes, target_states=target_hashes, state_args=("source_hash", "target_hash"))
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all tables: %s", e)
+            return []
 
     def synchronize_all_views(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT view_name FROM user_views")
-            views_to_sync = [view[0] for view in self.cursor.fetchall()]
+            # One round-trip per side for every object's name and DDL hash;
+            # full definitions are only fetched for objects whose hashes differ
+            target_hashes = self._load_all_hashes("view")
+            self._existing_views = set(target_hashes)
+            source_hashes = {}
 
-            for view in views_to_sync:
-                self.synchronize_view(view, alter_sync, source_code_hash, create_on_target)
-        except OracleError as e:
-            logging.error(f"Error synchronizing all views: {e}")
+            self._sync_all(self.synchronize_view, self._source_hashes("view", target_hashes, source_hashes), alter_sync, source_code_hash, create_on_target, source_states=source_hashes, target_states=target_hashes, state_args=("source_hash", "target_hash"))
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all views: %s", e)
 
     def synchronize_all_procedures(self, alter_sync, source_code_hash, create_on_target):
         try:
-            self.cursor.execute("SELECT object_name FROM user_procedures")
-            procedures_to_sync = [proc[0] for proc in self.cursor.fetchall()]
+            # One round-trip per side for every object's name and DDL hash;
+            # full definitions are only fetched for objects whose hashes differ
+            target_hashes = self._load_all_hashes("procedure")
+            self._existing_procedures = set(target_hashes)
+            source_hashes = {}
 
-            for procedure in procedures_to_sync:
-                self.synchronize_procedure(procedure, alter_sync, source_code_hash, create_on_target)
-        except OracleError as e:
-            logging.error(f"Error synchronizing all procedures: {e}")
+            self._sync_all(self.synchronize_procedure, self._source_hashes("procedure", target_hashes, source_hashes), alter_sync, source_code_hash, create_on_target, source_states=source_hashes, target_states=target_hashes, state_args=("source_hash", "target_hash"))
+        except self._drv.Error as e:
+            logging.error("Error synchronizing all procedures: %s", e)
 
     def synchronize_indexes(self, table):
         try:
-            self.cursor.execute(f"""
-                SELECT index_name, column_name
+            # One row per index with its key columns in order, so composite
+            # indexes are created once rather than once per column
+            self.cursor.execute("""
+                SELECT index_name, LISTAGG('"' || REPLACE(column_name, '"', '""') || '"', ', ') WITHIN GROUP (ORDER BY column_position)
                 FROM all_ind_columns
-                WHERE table_name = '{table.upper()}'
-            """)
-            indexes = self.cursor.fetchall()
-            for index in indexes:
-                create_index_statement = f"CREATE INDEX {index[0]} ON {table} ({index[1]})"
-                logging.info(f"Creating index: {create_index_statement}")
-                if self.test_sql_statement(create_index_statement):
-                    self.cursor.execute(create_index_statement)
-        except OracleError as e:
-            logging.error(f"Error synchronizing indexes for table {table}: {e}")
-
-    def rollback_table(self, table_name):
-        try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='table' AND object_name=:1 ORDER BY timestamp DESC LIMIT 1", (table_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+                WHERE table_name = :1
+                GROUP BY index_name
+            """, (table.upper(),))
+            statements = []
+            for index_name, column_names in self.cursor.fetchall():
+                statement = f"CREATE INDEX {_quote_oracle_identifier(index_name)} ON {_quote_oracle_identifier(table)} ({column_names})" + (" ONLINE" if self._supports_online else "")
+                logging.info("Creating index: %s", statement)
+                statements.append(statement)
+            if statements:
+                self._execute_ddl(self.cursor, *statements)
+        except self._drv.Error as e:
+            logging.error("Error synchronizing indexes for table %s: %s", table, e)
+
+    def rollback_table(self, table_name, entry=None):
+        try:
+            original_state, action = entry if entry is not None else self._last_log_entry("table", table_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP TABLE {table_name}")
-                logging.info(f"Dropped table {table_name} as part of rollback.")
+                self._queue_ddl(f"DROP TABLE {_quote_oracle_identifier(table_name)}", on_success=functools.partial(self._record_rollback, "table", table_name, None))
             elif action == 'alter' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back table {table_name} to its original state using: {original_state}")
+                self._queue_ddl(original_state, on_success=functools.partial(self._record_rollback, "table", table_name, original_state))
             else:
-                logging.warning(f"No rollback action found for table {table_name}.")
-        except OracleError as e:
-            logging.error(f"Error rolling back table {table_name}: {e}")
+                logging.warning("No rollback action found for table %s.", table_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back table %s: %s", table_name, e)
 
-    def rollback_view(self, view_name):
+    def rollback_view(self, view_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='view' AND object_name=:1 ORDER BY timestamp DESC LIMIT 1", (view_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("view", view_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP VIEW {view_name}")
-                logging.info(f"Dropped view {view_name} as part of rollback.")
+                self._queue_ddl(f"DROP VIEW {_quote_oracle_identifier(view_name)}", on_success=functools.partial(self._record_rollback, "view", view_name, None))
             elif action == 'sync' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back view {view_name} to its original state using: {original_state}")
+                self._queue_ddl(original_state, on_success=functools.partial(self._record_rollback, "view", view_name, original_state))
             else:
-                logging.warning(f"No rollback action found for view {view_name}.")
-        except OracleError as e:
-            logging.error(f"Error rolling back view {view_name}: {e}")
+                logging.warning("No rollback action found for view %s.", view_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back view %s: %s", view_name, e)
 
-    def rollback_procedure(self, procedure_name):
+    def rollback_procedure(self, procedure_name, entry=None):
         try:
-            self.cursor.execute("SELECT original_state, action FROM sync_log WHERE object_type='procedure' AND object_name=:1 ORDER BY timestamp DESC LIMIT 1", (procedure_name,))
-            row = self.cursor.fetchone()
-            original_state, action = row if row else (None, None)
+            original_state, action = entry if entry is not None else self._last_log_entry("procedure", procedure_name)
             
             if action == 'create':
-                self.cursor.execute(f"DROP PROCEDURE {procedure_name}")
-                logging.info(f"Dropped procedure {procedure_name} as part of rollback.")
+                self._queue_ddl(f"DROP PROCEDURE {_quote_oracle_identifier(procedure_name)}", on_success=functools.partial(self._record_rollback, "procedure", procedure_name, None))
             elif action == 'sync' and original_state:
-                if self.test_sql_statement(original_state):
-                    self.cursor.execute(original_state)
-                    logging.info(f"Rolled back procedure {procedure_name} to its original state using: {original_state}")
+                self._queue_ddl(original_state, on_success=functools.partial(self._record_rollback, "procedure", procedure_name, original_state))
             else:
-                logging.warning(f"No rollback action found for procedure {procedure_name}.")
-        except OracleError as e:
-            logging.error(f"Error rolling back procedure {procedure_name}: {e}")
+                logging.warning("No rollback action found for procedure %s.", procedure_name)
+        except self._drv.Error as e:
+            logging.error("Error rolling back procedure %s: %s", procedure_name, e)
 
 class DatabaseSyncFactory:
-    @staticmethod
-    def get_sync_instance(db_type, config):
-        if db_type == 'mysql':
-            return MySQLSync(config)
-        elif db_type == 'postgresql':
-            return PostgreSQLSync(config)
-        elif db_type == 'mongodb':
-            return MongoDBSync(config)
-        elif db_type == 'neo4j':
-            return Neo4jSync(config)
-        elif db_type == 'sqlserver':
-            return SQLServerSync(config)
-        elif db_type == 'oracle':
-            return OracleSync(config)
-        else:
+    _REGISTRY = {
+        'mysql': MySQLSync,
+        'postgresql': PostgreSQLSync,
+        'mongodb': MongoDBSync,
+        'neo4j': Neo4jSync,
+        'sqlserver': SQLServerSync,
+        'oracle': OracleSync,
+    }
+
+    @classmethod
+    def register(cls, db_type, sync_class):
+        cls._REGISTRY[db_type] = sync_class
+
+    @classmethod
+    def get_sync_instance(cls, db_type, config, max_workers=DEFAULT_MAX_WORKERS):
+        sync_class = cls._REGISTRY.get(db_type)
+        if sync_class is None:
             raise ValueError(f"Unsupported database type: {db_type}")
+        return sync_class(config, max_workers)
+
+MAX_TARGET_WORKERS = 8
+
+def _load_json(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    # orjson is optional; the standard library parser reads the same bytes
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _rollback_one_target(target_config, objects):
+    target_sync = DatabaseSyncFactory.get_sync_instance(target_config['type'], target_config['config'])
+    target_sync.connect()
+    target_sync.rollback_objects(objects)
+    target_sync.close()
+
+def _sync_one_target(target_config, source_sync, source_code_hash, args):
+    target_sync = DatabaseSyncFactory.get_sync_instance(target_config['type'], target_config['config'], args.max_workers)
+    target_sync.connect()
+    target_sync.skip_unmodified = args.skip_unmodified
+    # DDL is replayed verbatim, so only same-engine targets read from the source
+    if target_config['type'] == args.source_db_type:
+        target_sync.attach_source(source_sync)
+
+    sync_args = (args.alter_sync, source_code_hash, args.create_on_target)
+
+    if args.sync_all_tables:
+        synced_tables = target_sync.synchronize_all_tables(*sync_args)
+        if args.sync_indexes:
+            synchronize_indexes = target_sync.synchronize_indexes
+            for table in synced_tables:
+                synchronize_indexes(table)
+
+    if args.sync_all_views:
+        target_sync.synchronize_all_views(*sync_args)
+
+    if args.sync_all_procedures:
+        target_sync.synchronize_all_procedures(*sync_args)
+
+    target_sync.close()
+
+_process_source = None
+_process_source_args = None
+
+def _init_target_process(source_db_type, source_config, max_workers):
+    # Connections can't be shared across processes, so every worker process
+    # opens its own source. It isn't connected here: an initializer that
+    # raises kills the worker and Pool respawns it forever.
+    global _process_source_args
+    _process_source_args = (source_db_type, source_config, max_workers)
+
+def _connect_process_source():
+    # Opened by the first task and closed when the process exits
+    global _process_source
+    if _process_source is None:
+        source_sync = DatabaseSyncFactory.get_sync_instance(*_process_source_args)
+        source_sync.connect()
+        multiprocessing.util.Finalize(None, source_sync.close, exitpriority=10)
+        _process_source = source_sync
+    return _process_source
+
+def _sync_target_in_process(target_config, source_code_hash, args):
+    try:
+        source_sync = _connect_process_source()
+    except Exception as e:
+        logging.error("Error connecting to source database: %s", e)
+        return
+    _sync_one_target(target_config, source_sync, source_code_hash, args)
 
 def main():
     parser = argparse.ArgumentParser(description="Database Synchronization Tool")
@@ -1248,56 +2585,54 @@ def main():
     parser.add_argument("--alter-sync", action="store_true", help="Use ALTER statements to sync tables, views, and procedures")
     parser.add_argument("--create-on-target", action="store_true", help="Create objects on target if they don't exist in source")
     parser.add_argument("--sync-indexes", action="store_true", help="Sync indexes for tables")
-    parser.add_argument("--rollback", help="Rollback changes for a specific object (format: type:name)")
+    parser.add_argument("--rollback", help="Rollback changes for specific objects (format: type:name[,type:name...])")
+    parser.add_argument("--skip-unmodified", action="store_true", help="Skip tables whose source change time predates their last logged sync")
+    parser.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS, help="Number of objects to synchronize concurrently per target")
+    parser.add_argument("--processes", type=int, default=1, help="Number of processes to spread targets across")
     args = parser.parse_args()
 
     if not (args.source_config and args.source_db_type and args.target_configs):
         logging.error("Please provide source and target configuration files and source database type.")
         return
 
-    with open(args.source_config, 'r') as f:
-        source_config = json.load(f)
+    source_config = _load_json(args.source_config)
+    target_configs = _load_json(args.target_configs)
 
-    with open(args.target_configs, 'r') as f:
-        target_configs = json.load(f)
+    # Targets are independent databases, so they are synchronized side by
+    # side, each on its own sync instance
+    target_workers = max(1, min(len(target_configs), MAX_TARGET_WORKERS))
 
     if args.rollback:
-        obj_type, obj_name = args.rollback.split(':')
-        for target_config in target_configs:
-            target_sync = DatabaseSyncFactory.get_sync_instance(target_config['type'], target_config['config'])
-            target_sync.connect()
-            if obj_type == 'table':
-                target_sync.rollback_table(obj_name)
-            elif obj_type == 'view':
-                target_sync.rollback_view(obj_name)
-            elif obj_type == 'procedure':
-                target_sync.rollback_procedure(obj_name)
-            else:
-                logging.error(f"Unsupported rollback object type: {obj_type}")
-            target_sync.close()
+        objects = []
+        for item in args.rollback.split(','):
+            obj_type, obj_name = item.split(':', 1)
+            # Reported once here rather than once per target
+            if obj_type not in DatabaseSync.ROLLBACK_METHODS:
+                logging.error("Unsupported rollback object type: %s", obj_type)
+                continue
+            objects.append((obj_type, obj_name))
+        if not objects:
+            return
+        with ThreadPoolExecutor(max_workers=target_workers) as executor:
+            list(executor.map(functools.partial(_rollback_one_target, objects=objects), target_configs))
+    elif args.processes > 1:
+        # Each process synchronizes one target at a time against its own source
+        processes = max(1, min(len(target_configs), args.processes))
+        with multiprocessing.Pool(processes, initializer=_init_target_process, initargs=(args.source_db_type, source_config, args.max_workers)) as pool:
+            pool.map(functools.partial(_sync_target_in_process, source_code_hash=_SOURCE_HASH, args=args), target_configs)
+            # Let the workers exit normally so their sources are closed
+            pool.close()
+            pool.join()
     else:
-        source_sync = DatabaseSyncFactory.get_sync_instance(args.source_db_type, source_config)
+        # Every target's workers borrow from the source's pool, so it is sized
+        # for all of them
+        source_sync = DatabaseSyncFactory.get_sync_instance(args.source_db_type, source_config, args.max_workers * target_workers)
         source_sync.connect()
 
-        source_code_hash = hashlib.md5(open(__file__, 'rb').read()).hexdigest()
-
-        for target_config in target_configs:
-            target_sync = DatabaseSyncFactory.get_sync_instance(target_config['type'], target_config['config'])
-            target_sync.connect()
-
-            if args.sync_all_tables:
-                target_sync.synchronize_all_tables(args.alter_sync, source_code_hash, args.create_on_target)
-                if args.sync_indexes:
-                    for table in target_sync.get_tables():
-                        target_sync.synchronize_indexes(table)
-
-            if args.sync_all_views:
-                target_sync.synchronize_all_views(args.alter_sync, source_code_hash, args.create_on_target)
-
-            if args.sync_all_procedures:
-                target_sync.synchronize_all_procedures(args.alter_sync, source_code_hash, args.create_on_target)
+        source_code_hash = _SOURCE_HASH
 
-            target_sync.close()
+        with ThreadPoolExecutor(max_workers=target_workers) as executor:
+            list(executor.map(functools.partial(_sync_one_target, source_sync=source_sync, source_code_hash=source_code_hash, args=args), target_configs))
 
         source_sync.close()
 